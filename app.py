@@ -5,14 +5,19 @@ Streamlit UI with pipeline visualization
 
 import streamlit as st
 import sys
+import asyncio
+import hashlib
+import threading
+from collections import Counter
+from collections.abc import Mapping
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from nuance.claude_client import ClaudeClient
-from nuance.statistical_checks import StatisticalAnalyzer, analyze_text, check_claims
-from nuance.schemas import ClaimAudit, TextMetrics
+from nuance.claude_client import ClaudeClient, CounterfactualItem
+from nuance.statistical_checks import analyze_text, check_claims
+from nuance.schemas import ClaimAudit, ClaimsExtraction, TextMetrics
 
 
 # Page configuration
@@ -22,8 +27,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Number of past audits kept per session for instant re-display of unchanged text
+AUDIT_CACHE_SIZE = 8
+
+# Static page content, built once at import rather than inside main() on every rerun
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -58,49 +66,9 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
-
-
-def main():
-    """Main application logic"""
-
-    # Header
-    st.markdown('<div class="main-header">🔍 Nuance</div>', unsafe_allow_html=True)
-    st.markdown(
-        '<div class="sub-header">AI-Powered Statistical Reasoning Auditor</div>',
-        unsafe_allow_html=True
-    )
-
-    st.markdown("""
-    **Nuance** audits text for statistical bullshit and sloppy logic. Paste a news article, blog post,
-    or report below, and we'll analyze it for logical fallacies, missing context, and hand-wavy claims.
-    """)
-
-    # Sidebar
-    with st.sidebar:
-        st.header("About Nuance")
-        st.markdown("""
-        ### How it works
-
-        **1. Extraction (Neuro)**
-        - Claude extracts statistical claims
-        - Strict schema validation with retry
-
-        **2. Analysis (Symbolic)**
-        - Python runs deterministic checks
-        - No guessing - real statistical analysis
-
-        **3. Synthesis**
-        - Educational feedback on findings
-        - Train your bullshit detector
-
-        ---
-
-        ### Example Articles
-        """)
+"""
 
-        if st.button("Load Example: Cybersecurity Scare (Technical)"):
-            st.session_state['example_text'] = """
+_EXAMPLE_CYBER = """
             Headline: Cybercrime Wave: Attacks Have Tripled in 2025
 
             Our latest security report shows a terrifying trend: Ransomware attacks on
@@ -116,8 +84,7 @@ def main():
             businesses that ignored this warning were compromised within weeks.
             """
 
-        if st.button("Load Example: Wine = Exercise (Viral Health Claim)"):
-            st.session_state['example_text'] = """
+_EXAMPLE_WINE = """
             Drop and give me twenty… ounces of merlot, that is!
 
             Red wine equals gym time! Thanks to Jason Dyck and some research
@@ -150,6 +117,97 @@ def main():
             your actual gym sessions for all the same reasons listed above.
             """
 
+# Custom CSS (re-emitted every run: Streamlit only keeps elements rendered in the current run)
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_claude_client() -> ClaudeClient:
+    """
+    Shared Claude client for the whole Streamlit server.
+
+    Streamlit re-executes the script on every widget interaction; caching the
+    client keeps one Anthropic HTTP connection pool warm across reruns instead
+    of rebuilding it each time.
+    """
+    return ClaudeClient()
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop running in a background thread.
+
+    The async Anthropic client's connection pool is bound to the loop it first
+    ran on, so every async Claude call is scheduled here rather than in a fresh
+    asyncio.run() per rerun.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_extract_claims(text: str, model: str) -> ClaimsExtraction:
+    """
+    Extract claims once per (text, model) pair.
+
+    Prediction mode and the analysis button both need claims for the same
+    text; caching avoids paying for a second Claude round trip.
+    """
+    return get_claude_client().extract_claims(text)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def compute_text_metrics(text: str) -> TextMetrics:
+    """Deterministic text metrics, cached so reruns skip the regex passes."""
+    return analyze_text(text)
+
+
+def main():
+    """Main application logic"""
+
+    # Header
+    st.markdown('<div class="main-header">🔍 Nuance</div>', unsafe_allow_html=True)
+    st.markdown(
+        '<div class="sub-header">AI-Powered Statistical Reasoning Auditor</div>',
+        unsafe_allow_html=True
+    )
+
+    st.markdown("""
+    **Nuance** audits text for statistical bullshit and sloppy logic. Paste a news article, blog post,
+    or report below, and we'll analyze it for logical fallacies, missing context, and hand-wavy claims.
+    """)
+
+    # Sidebar
+    with st.sidebar:
+        st.header("About Nuance")
+        st.markdown("""
+        ### How it works
+
+        **1. Extraction (Neuro)**
+        - Claude extracts statistical claims
+        - Strict schema validation with retry
+
+        **2. Analysis (Symbolic)**
+        - Python runs deterministic checks
+        - No guessing - real statistical analysis
+
+        **3. Synthesis**
+        - Educational feedback on findings
+        - Train your bullshit detector
+
+        ---
+
+        ### Example Articles
+        """)
+
+        if st.button("Load Example: Cybersecurity Scare (Technical)"):
+            st.session_state['example_text'] = _EXAMPLE_CYBER
+
+        if st.button("Load Example: Wine = Exercise (Viral Health Claim)"):
+            st.session_state['example_text'] = _EXAMPLE_WINE
+
     # Text input
     default_text = st.session_state.get('example_text', '')
     text_input = st.text_area(
@@ -167,116 +225,18 @@ def main():
     )
 
     # Initialize session state for thinking mode
-    if 'user_predictions' not in st.session_state:
-        st.session_state['user_predictions'] = {}
     if 'show_predictions' not in st.session_state:
         st.session_state['show_predictions'] = False
+    if 'prediction_answers' not in st.session_state:
+        st.session_state['prediction_answers'] = {}
 
-    # If thinking mode enabled and text provided, extract claims for prediction
-    if thinking_mode and text_input.strip() and not st.session_state.get('show_predictions', False):
-        if st.button("📝 Start Prediction Phase", type="secondary"):
-            with st.spinner("Extracting claims for you to evaluate..."):
-                try:
-                    client = ClaudeClient()
-                    claims_extraction = client.extract_claims(text_input)
-                    st.session_state['extracted_claims'] = claims_extraction.claims
-                    st.session_state['show_predictions'] = True
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Error extracting claims: {e}")
-
-    # Show prediction interface if in thinking mode and claims extracted
-    if thinking_mode and st.session_state.get('show_predictions', False):
-        st.markdown("### 🎯 Make Your Predictions")
-        st.info("For each claim below, select which issues you think it has. Then click 'Run Analysis' to see how you did!\n\n**Note:** Some claims may have no issues. If you think a claim is fine, leave all checkboxes unchecked.")
-
-        extracted_claims = st.session_state.get('extracted_claims', [])
-
-        if not extracted_claims:
-            st.warning("⚠️ No claims were extracted. Try different text or disable Think-Before-Reveal mode.")
-        elif extracted_claims:
-            max_to_show = st.slider(
-                "How many claims to review now?",
-                min_value=1,
-                max_value=len(extracted_claims),
-                value=min(5, len(extracted_claims)),
-                help="Adjust to avoid a wall of questions; you can review more by moving the slider."
-            )
-
-            claims_to_review = extracted_claims[:max_to_show]
-            if len(extracted_claims) > max_to_show:
-                st.caption(f"Showing first {max_to_show} of {len(extracted_claims)} claims. Move the slider to see more.")
-
-            # Clean up predictions for claims beyond current slider value
-            claims_to_review_ids = {claim.claim_id for claim in claims_to_review}
-            predictions_to_remove = [
-                claim_id for claim_id in st.session_state['user_predictions'].keys()
-                if claim_id not in claims_to_review_ids
-            ]
-            for claim_id in predictions_to_remove:
-                del st.session_state['user_predictions'][claim_id]
-
-            for claim in claims_to_review:
-                with st.expander(f"{claim.claim_id.upper()}: {claim.quote[:120]}..."):
-                    st.markdown(f"**Full Claim:** {claim.quote}")
-
-                    # Prediction options
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        corr = st.checkbox(
-                            "Correlation/Causation issue",
-                            key=f"pred_{claim.claim_id}_corr"
-                        )
-                        sample = st.checkbox(
-                            "Missing sample size",
-                            key=f"pred_{claim.claim_id}_sample"
-                        )
-                        extreme = st.checkbox(
-                            "Extreme language",
-                            key=f"pred_{claim.claim_id}_extreme"
-                        )
-                        relative_risk = st.checkbox(
-                            "Relative risk without context",
-                            key=f"pred_{claim.claim_id}_relative_risk"
-                        )
-
-                    with col2:
-                        base_rate = st.checkbox(
-                            "Base rate neglect",
-                            key=f"pred_{claim.claim_id}_base"
-                        )
-                        data_support = st.checkbox(
-                            "Inadequate data support",
-                            key=f"pred_{claim.claim_id}_data"
-                        )
-                        missing_comparator = st.checkbox(
-                            "Missing comparator",
-                            key=f"pred_{claim.claim_id}_comparator"
-                        )
-
-                    # Store predictions
-                    st.session_state['user_predictions'][claim.claim_id] = {
-                        'correlation': corr,
-                        'sample_size': sample,
-                        'extreme_language': extreme,
-                        'base_rate': base_rate,
-                        'data_support': data_support,
-                        'relative_risk': relative_risk,
-                        'missing_comparator': missing_comparator
-                    }
-
-        st.markdown("### ✅ Ready to See How You Did?")
-
-        # Add restart button in prediction mode
-        if st.button("🔄 Start Over (New Text)", key="restart_predictions", type="secondary"):
-            st.session_state['show_predictions'] = False
-            st.session_state['user_predictions'] = {}
-            st.session_state['extracted_claims'] = []
-            st.rerun()
+    # Think-Before-Reveal runs as a fragment so prediction widgets rerun in isolation
+    if thinking_mode:
+        prediction_phase(text_input)
 
     # Analyze button (modified label for thinking mode)
-    button_label = "🔍 Run Analysis & Compare" if (thinking_mode and st.session_state.get('show_predictions')) else "🔍 Audit This Text"
+    # (based on the checkbox alone: fragment reruns don't refresh widgets outside the fragment)
+    button_label = "🔍 Run Analysis & Compare" if thinking_mode else "🔍 Audit This Text"
     if st.button(button_label, type="primary"):
         if not text_input.strip():
             st.error("Please paste some text to analyze.")
@@ -299,70 +259,119 @@ def main():
         step3_placeholder = st.empty()
 
         try:
-            # STEP 1: Extract claims
-            step1_placeholder.info("⏳ **Step 1:** Extracting statistical claims...")
-
-            client = ClaudeClient()
-            claims_extraction = client.extract_claims(text_input)
-
-            step1_placeholder.success(
-                f"✅ **Step 1 Complete:** Extracted {claims_extraction.total_claims} claims"
-            )
-
-            # STEP 2: Run statistical checks
-            step2_placeholder.info("⏳ **Step 2:** Running deterministic statistical checks...")
-
-            analyzer = StatisticalAnalyzer(text_input)
-            text_metrics = analyzer.calculate_text_metrics()
-
-            # Run checks on each claim
-            claim_check_results = {}
-            for claim in claims_extraction.claims:
-                claim_check_results[claim.claim_id] = analyzer.check_claim(claim)
-
-            # Create ClaimAudit objects
-            claim_audits = []
-            for claim in claims_extraction.claims:
-                checks = claim_check_results[claim.claim_id]
-                failed_checks = [c for c in checks if not c.passed]
-
-                # Determine overall status
-                if any(c.severity == "critical" for c in failed_checks):
-                    status = "critical"
-                elif any(c.severity == "high" for c in failed_checks):
-                    status = "major_issues"
-                elif failed_checks:
-                    status = "minor_issues"
-                else:
-                    status = "clean"
+            # Clicking again on unchanged text reuses this session's previous audit
+            text_hash = hashlib.blake2b(text_input.encode(), digest_size=16).hexdigest()
+            audit_cache = st.session_state.setdefault('audit_cache', {})
 
-                claim_audits.append(ClaimAudit(
-                    claim_id=claim.claim_id,
-                    claim_quote=claim.quote,
-                    checks_performed=checks,
-                    overall_status=status
-                ))
+            if text_hash in audit_cache:
+                (claims_extraction, text_metrics, claim_audits, total_issues, errors_by_type,
+                 clean_claims, summary, counterfactuals_by_type, reliability_score) = audit_cache[text_hash]
+                counterfactual_error = None
 
-            total_issues = sum(len([c for c in audit.checks_performed if not c.passed])
-                             for audit in claim_audits)
+                step1_placeholder.success(
+                    f"✅ **Step 1 Complete:** Extracted {claims_extraction.total_claims} claims"
+                )
+                step2_placeholder.success(
+                    f"✅ **Step 2 Complete:** Found {total_issues} potential issues"
+                )
+            else:
+                # STEP 1: Extract claims
+                step1_placeholder.info("⏳ **Step 1:** Extracting statistical claims...")
+
+                client = get_claude_client()
+
+                # Reuse the extraction from the prediction phase when it was for this text;
+                # otherwise start Claude in the background and compute text metrics meanwhile
+                claims_extraction = st.session_state.get('claims_extraction')
+                extraction_future = None
+                if claims_extraction is None or st.session_state.get('predicted_text') != text_input:
+                    extraction_future = asyncio.run_coroutine_threadsafe(
+                        client.aextract_claims(text_input),
+                        get_event_loop()
+                    )
 
-            step2_placeholder.success(
-                f"✅ **Step 2 Complete:** Found {total_issues} potential issues"
-            )
+                text_metrics = compute_text_metrics(text_input)
 
-            # STEP 3: Generate summary
-            step3_placeholder.info("⏳ **Step 3:** Generating audit report...")
+                if extraction_future is not None:
+                    claims_extraction = extraction_future.result()
 
-            summary = client.generate_audit_summary(
-                original_text=text_input,
-                claim_audits=claim_audits,
-                text_metrics=text_metrics.model_dump()
-            )
+                step1_placeholder.success(
+                    f"✅ **Step 1 Complete:** Extracted {claims_extraction.total_claims} claims"
+                )
 
-            # Calculate overall reliability score (0-100)
-            reliability_score = calculate_reliability_score(text_metrics, claim_audits)
+                # STEP 2: Run statistical checks
+                step2_placeholder.info("⏳ **Step 2:** Running deterministic statistical checks...")
 
-            step3_placeholder.success("✅ **Step 3 Complete:** Audit report ready")
+                # Run checks on each claim
+                claims = claims_extraction.claims
+                claim_check_results = check_claims(text_input, claims)
+
+                # Create ClaimAudit objects (checks are our own validated output, so skip re-validation)
+                claim_audits = [
+                    ClaimAudit.model_construct(
+                        claim_id=claim.claim_id,
+                        claim_quote=claim.quote,
+                        checks_performed=claim_check_results[claim.claim_id],
+                        overall_status=audit_status(claim_check_results[claim.claim_id])
+                    )
+                    for claim in claims
+                ]
+
+                total_issues = sum(len(audit.failed_checks) for audit in claim_audits)
+
+                step2_placeholder.success(
+                    f"✅ **Step 2 Complete:** Found {total_issues} potential issues"
+                )
+
+                # Collect all errors and group by check name
+                errors_by_type = {}
+                clean_claims = []
+
+                for audit in claim_audits:
+                    failed_checks = audit.failed_checks
+
+                    if not failed_checks:
+                        clean_claims.append({
+                            'id': audit.claim_id,
+                            'quote': audit.claim_quote
+                        })
+                    else:
+                        for check in failed_checks:
+                            if check.check_name not in errors_by_type:
+                                errors_by_type[check.check_name] = {
+                                    'check': check,
+                                    'claims': {}
+                                }
+                            # Keyed by claim_id to avoid duplicates
+                            affected = errors_by_type[check.check_name]['claims']
+                            if audit.claim_id not in affected:
+                                affected[audit.claim_id] = {
+                                    'id': audit.claim_id,
+                                    'quote': audit.claim_quote
+                                }
+
+                # Counterfactuals are generated for all high/medium issue types in one call
+                counterfactual_items = [
+                    CounterfactualItem(
+                        fallacy_type=error_type,
+                        claim_quote=next(iter(error_data['claims'].values()))['quote'],
+                        check_explanation=error_data['check'].explanation
+                    )
+                    for error_type, error_data in errors_by_type.items()
+                    if error_data['check'].severity in ('high', 'medium')
+                ]
+
+                # STEP 3: Counterfactuals run in the background while the summary streams below
+                step3_placeholder.info("⏳ **Step 3:** Generating audit report...")
+
+                counterfactual_future = asyncio.run_coroutine_threadsafe(
+                    client.agenerate_counterfactuals_batch(counterfactual_items),
+                    get_event_loop()
+                )
+                summary = None
+
+                # Calculate overall reliability score (0-100)
+                reliability_score = calculate_reliability_score(text_metrics, claim_audits)
 
             # Display results
             st.markdown("---")
@@ -411,41 +420,42 @@ def main():
                     st.write(f"- **Extreme Language:** {text_metrics.extreme_language_count} instances")
                     st.write(f"- **Causation Claims:** {text_metrics.causation_language_count} instances")
 
-            # Summary
+            # Summary (streamed for a fresh audit, replayed from the cache otherwise)
             st.markdown("### 🎯 Summary")
-            st.markdown(summary)
-
-            # Group issues by error type
-            st.markdown("### 📊 Issues Grouped by Type")
+            if summary is None:
+                summary = ""
+                summary_placeholder = st.empty()
+                for chunk in client.stream_audit_summary(
+                    original_text=text_input,
+                    claim_audits=claim_audits,
+                    text_metrics=text_metrics.model_dump()
+                ):
+                    summary += chunk
+                    summary_placeholder.markdown(summary)
 
-            # Collect all errors and group by check name
-            errors_by_type = {}
-            clean_claims = []
+                # Counterfactuals are optional; keep the report if only they failed
+                counterfactual_error = None
+                try:
+                    counterfactuals_by_type = counterfactual_future.result()
+                except Exception as e:
+                    counterfactual_error = e
+                    counterfactuals_by_type = {}
+
+                # Keep only complete reports; a counterfactual failure is worth retrying
+                if counterfactual_error is None:
+                    if len(audit_cache) >= AUDIT_CACHE_SIZE:
+                        del audit_cache[next(iter(audit_cache))]
+                    audit_cache[text_hash] = (
+                        claims_extraction, text_metrics, claim_audits, total_issues, errors_by_type,
+                        clean_claims, summary, counterfactuals_by_type, reliability_score
+                    )
+            else:
+                st.markdown(summary)
 
-            for audit in claim_audits:
-                failed_checks = [c for c in audit.checks_performed if not c.passed]
+            step3_placeholder.success("✅ **Step 3 Complete:** Audit report ready")
 
-                if not failed_checks:
-                    clean_claims.append({
-                        'id': audit.claim_id,
-                        'quote': audit.claim_quote
-                    })
-                else:
-                    for check in failed_checks:
-                        if check.check_name not in errors_by_type:
-                            errors_by_type[check.check_name] = {
-                                'check': check,
-                                'claims': []
-                            }
-                        # Avoid duplicates
-                        claim_exists = any(
-                            c['id'] == audit.claim_id for c in errors_by_type[check.check_name]['claims']
-                        )
-                        if not claim_exists:
-                            errors_by_type[check.check_name]['claims'].append({
-                                'id': audit.claim_id,
-                                'quote': audit.claim_quote
-                            })
+            # Group issues by error type
+            st.markdown("### 📊 Issues Grouped by Type")
 
             # Show errors grouped by type
             if errors_by_type:
@@ -457,7 +467,7 @@ def main():
                     key=lambda x: (severity_order.get(x[1]['check'].severity, 4), -len(x[1]['claims']))
                 ):
                     check = error_data['check']
-                    affected_claims = error_data['claims']
+                    affected_claims = list(error_data['claims'].values())
                     count = len(affected_claims)
 
                     # Severity styling
@@ -494,26 +504,18 @@ def main():
                             st.markdown("---")
                             st.markdown("**🧠 Think Deeper: Alternative Explanations**")
 
-                            with st.spinner("Generating alternative perspectives..."):
-                                try:
-                                    # Use first claim as example
-                                    example_claim = affected_claims[0]['quote']
-
-                                    counterfactuals = client.generate_counterfactuals(
-                                        claim_quote=example_claim,
-                                        fallacy_type=check.check_name,
-                                        check_explanation=check.explanation
-                                    )
+                            counterfactuals = counterfactuals_by_type.get(error_type)
+                            if counterfactuals:
+                                st.markdown("*What else could explain this?*")
+                                for i, alternative in enumerate(counterfactuals, 1):
+                                    if alternative:
+                                        st.markdown(f"{i}. {alternative}")
 
-                                    st.markdown("*What else could explain this?*")
-                                    for i, alternative in enumerate(counterfactuals, 1):
-                                        if alternative:
-                                            st.markdown(f"{i}. {alternative}")
-
-                                    st.info("💡 Tip: Always consider alternative explanations before accepting claims at face value.")
-
-                                except Exception as e:
-                                    st.warning(f"Could not generate alternatives: {type(e).__name__}. This feature requires API access.")
+                                st.info("💡 Tip: Always consider alternative explanations before accepting claims at face value.")
+                            elif counterfactual_error is not None:
+                                st.warning(f"Could not generate alternatives: {type(counterfactual_error).__name__}. This feature requires API access.")
+                            else:
+                                st.warning("Could not generate alternatives for this issue.")
 
             # Show clean claims
             if clean_claims:
@@ -523,13 +525,13 @@ def main():
                         st.markdown(f"• **{claim_info['id'].upper()}:** {claim_info['quote']}")
 
             # Think-Before-Reveal Mode: Show comparison if predictions were made
-            if thinking_mode and st.session_state.get('user_predictions'):
+            user_predictions = get_user_predictions()
+            if thinking_mode and user_predictions:
                 st.markdown("---")
                 st.markdown("## 🎯 You vs AI Analysis")
                 st.info("See how your predictions compared to the AI's analysis!")
 
                 # Calculate accuracy
-                user_predictions = st.session_state['user_predictions']
                 accuracy_metrics = calculate_prediction_accuracy(user_predictions, claim_audits)
 
                 # Overall score
@@ -606,10 +608,7 @@ def main():
                     st.markdown("Keep practicing to build your critical thinking skills!")
 
                 # Reset button
-                if st.button("🔄 Try Another Text"):
-                    st.session_state['show_predictions'] = False
-                    st.session_state['user_predictions'] = {}
-                    st.rerun()
+                st.button("🔄 Try Another Text", on_click=reset_predictions)
 
         except Exception as e:
             error_type = type(e).__name__
@@ -629,6 +628,187 @@ def main():
                 st.info("If this persists, check your API key and network connection.")
 
 
+# Prediction checkbox key suffixes: each answer is keyed f"pred_{claim_id}_{suffix}"
+PREDICTIONS_PER_PAGE = 5
+PREDICTION_WIDGETS = {
+    'correlation': 'corr',
+    'sample_size': 'sample',
+    'extreme_language': 'extreme',
+    'base_rate': 'base',
+    'data_support': 'data',
+    'relative_risk': 'relative_risk',
+    'missing_comparator': 'comparator'
+}
+
+
+class PredictionView(Mapping):
+    """
+    Read-only {claim_id: {issue_type: bool}} view over the prediction answers.
+
+    Answers are read from st.session_state['prediction_answers'] on access,
+    so rendering the prediction UI never rebuilds a predictions dict.
+    """
+
+    def __init__(self, claim_ids):
+        self._claim_ids = dict.fromkeys(claim_ids)
+
+    def __getitem__(self, claim_id: str) -> dict:
+        if claim_id not in self._claim_ids:
+            raise KeyError(claim_id)
+        answers = st.session_state.get('prediction_answers', {})
+        return {
+            issue: answers.get(f"pred_{claim_id}_{suffix}", False)
+            for issue, suffix in PREDICTION_WIDGETS.items()
+        }
+
+    def __iter__(self):
+        return iter(self._claim_ids)
+
+    def __len__(self) -> int:
+        return len(self._claim_ids)
+
+
+def get_user_predictions() -> PredictionView:
+    """Predictions for the claims currently under review in the prediction phase."""
+    extracted_claims = st.session_state.get('extracted_claims', [])
+    count = st.session_state.get('claims_to_review_count', 0)
+    return PredictionView(claim.claim_id for claim in extracted_claims[:count])
+
+
+def save_prediction(key: str):
+    """Checkbox callback: persist one answer so it survives its page being unrendered."""
+    st.session_state['prediction_answers'][key] = st.session_state[key]
+
+
+def turn_prediction_page(step: int):
+    """Pager button callback."""
+    st.session_state['pred_page'] += step
+
+
+def prediction_checkbox(label: str, claim_id: str, issue: str):
+    """Render one prediction checkbox, restoring its answer from prediction_answers."""
+    key = f"pred_{claim_id}_{PREDICTION_WIDGETS[issue]}"
+    st.checkbox(
+        label,
+        key=key,
+        value=st.session_state['prediction_answers'].get(key, False),
+        on_change=save_prediction,
+        args=(key,)
+    )
+
+
+def reset_predictions():
+    """Clear Think-Before-Reveal state. Used as a button callback, so no st.rerun() is needed."""
+    st.session_state['show_predictions'] = False
+    st.session_state['prediction_answers'] = {}
+    st.session_state['pred_page'] = 0
+    st.session_state['extracted_claims'] = []
+    st.session_state['claims_extraction'] = None
+
+
+@st.fragment
+def prediction_phase(text_input: str):
+    """
+    Think-Before-Reveal prediction UI.
+
+    Runs as a fragment: the extraction button, prediction checkboxes, pager
+    and restart button rerun only this function instead of the whole page.
+    Only one page of claims is rendered at a time.
+    """
+    # Extract claims for prediction once text is provided
+    if not st.session_state.get('show_predictions', False):
+        if not text_input.strip() or not st.button("📝 Start Prediction Phase", type="secondary"):
+            return
+
+        with st.spinner("Extracting claims for you to evaluate..."):
+            try:
+                client = get_claude_client()
+                claims_extraction = cached_extract_claims(text_input, client.model)
+                st.session_state['claims_extraction'] = claims_extraction
+                st.session_state['predicted_text'] = text_input
+                st.session_state['extracted_claims'] = claims_extraction.claims
+                st.session_state['show_predictions'] = True
+            except Exception as e:
+                st.error(f"Error extracting claims: {e}")
+                return
+
+    # Show prediction interface once claims are extracted
+    st.markdown("### 🎯 Make Your Predictions")
+    st.info("For each claim below, select which issues you think it has. Then click 'Run Analysis' to see how you did!\n\n**Note:** Some claims may have no issues. If you think a claim is fine, leave all checkboxes unchecked.")
+
+    extracted_claims = st.session_state.get('extracted_claims', [])
+
+    if not extracted_claims:
+        st.warning("⚠️ No claims were extracted. Try different text or disable Think-Before-Reveal mode.")
+    elif extracted_claims:
+        max_to_show = st.slider(
+            "How many claims to review now?",
+            min_value=1,
+            max_value=len(extracted_claims),
+            value=min(5, len(extracted_claims)),
+            key="claims_to_review_count",
+            help="Adjust to avoid a wall of questions; you can review more by moving the slider."
+        )
+
+        claims_to_review = extracted_claims[:max_to_show]
+        if len(extracted_claims) > max_to_show:
+            st.caption(f"Showing first {max_to_show} of {len(extracted_claims)} claims. Move the slider to see more.")
+
+        # Render one page of claims at a time
+        page_count = (len(claims_to_review) + PREDICTIONS_PER_PAGE - 1) // PREDICTIONS_PER_PAGE
+        page = min(st.session_state.get('pred_page', 0), page_count - 1)
+        if st.session_state.get('pred_page') != page:
+            st.session_state['pred_page'] = page
+        start = page * PREDICTIONS_PER_PAGE
+
+        for claim in claims_to_review[start:start + PREDICTIONS_PER_PAGE]:
+            with st.expander(f"{claim.claim_id.upper()}: {claim.quote[:120]}..."):
+                st.markdown(f"**Full Claim:** {claim.quote}")
+
+                # Prediction options
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    prediction_checkbox("Correlation/Causation issue", claim.claim_id, 'correlation')
+                    prediction_checkbox("Missing sample size", claim.claim_id, 'sample_size')
+                    prediction_checkbox("Extreme language", claim.claim_id, 'extreme_language')
+                    prediction_checkbox("Relative risk without context", claim.claim_id, 'relative_risk')
+
+                with col2:
+                    prediction_checkbox("Base rate neglect", claim.claim_id, 'base_rate')
+                    prediction_checkbox("Inadequate data support", claim.claim_id, 'data_support')
+                    prediction_checkbox("Missing comparator", claim.claim_id, 'missing_comparator')
+
+        if page_count > 1:
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("◀ Previous", key="prediction_prev", disabled=page == 0,
+                          on_click=turn_prediction_page, args=(-1,))
+            with page_col:
+                st.caption(f"Page {page + 1} of {page_count}")
+            with next_col:
+                st.button("Next ▶", key="prediction_next", disabled=page >= page_count - 1,
+                          on_click=turn_prediction_page, args=(1,))
+
+    st.markdown("### ✅ Ready to See How You Did?")
+
+    # Add restart button in prediction mode
+    st.button("🔄 Start Over (New Text)", key="restart_predictions", type="secondary", on_click=reset_predictions)
+
+
+# Mapping between prediction keys and check names
+PRED_TO_CHECK = {
+    'correlation': 'Correlation vs Causation',
+    'sample_size': 'Sample Size Disclosure',
+    'extreme_language': 'Extreme Language',
+    'base_rate': 'Base Rate Neglect',
+    'data_support': 'Data Support',
+    'relative_risk': 'Relative Risk Without Context',
+    'missing_comparator': 'Missing Comparator'
+}
+CHECK_TO_PRED = {check_name: pred_key for pred_key, check_name in PRED_TO_CHECK.items()}
+
+
 def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) -> dict:
     """
     Compare user predictions to actual analysis results.
@@ -640,24 +820,14 @@ def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) ->
     Returns:
         Dict with accuracy metrics
     """
-    # Mapping between prediction keys and check names
-    PRED_TO_CHECK = {
-        'correlation': 'Correlation vs Causation',
-        'sample_size': 'Sample Size Disclosure',
-        'extreme_language': 'Extreme Language',
-        'base_rate': 'Base Rate Neglect',
-        'data_support': 'Data Support',
-        'relative_risk': 'Relative Risk Without Context',
-        'missing_comparator': 'Missing Comparator'
-    }
-
     total_issues = 0
     true_positives = 0
     false_positives = 0
     false_negatives = 0
 
     per_claim_metrics = {}
-    by_type_metrics = {issue: {'caught': 0, 'total': 0} for issue in PRED_TO_CHECK.keys()}
+    caught_by_type = Counter()
+    total_by_type = Counter()
 
     for audit in claim_audits:
         claim_id = audit.claim_id
@@ -672,19 +842,11 @@ def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) ->
             issue for issue, flagged in user_pred.items() if flagged
         }
 
-        # Get actual issues from checks
-        actual_checks = {
-            check.check_name for check in audit.checks_performed if not check.passed
+        # Map failed check names to prediction keys
+        actual_issues = {
+            CHECK_TO_PRED[name] for name in audit.failed_check_names if name in CHECK_TO_PRED
         }
 
-        # Map check names to prediction keys
-        actual_issues = set()
-        for check_name in actual_checks:
-            for pred_key, check_full_name in PRED_TO_CHECK.items():
-                if check_full_name in check_name:
-                    actual_issues.add(pred_key)
-                    break
-
         # Calculate matches
         caught = predicted_issues & actual_issues
         missed = actual_issues - predicted_issues
@@ -697,10 +859,8 @@ def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) ->
         false_negatives += len(missed)
 
         # Track by type
-        for issue in actual_issues:
-            by_type_metrics[issue]['total'] += 1
-            if issue in caught:
-                by_type_metrics[issue]['caught'] += 1
+        total_by_type.update(actual_issues)
+        caught_by_type.update(caught)
 
         # Store per-claim metrics
         per_claim_metrics[claim_id] = {
@@ -715,6 +875,11 @@ def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) ->
     # Calculate overall accuracy (as decimal 0-1, will be formatted as % in UI)
     overall_accuracy = (true_positives / total_issues) if total_issues > 0 else 0
 
+    by_type_metrics = {
+        issue: {'caught': caught_by_type[issue], 'total': total_by_type[issue]}
+        for issue in PRED_TO_CHECK
+    }
+
     return {
         'overall_accuracy': overall_accuracy,
         'true_positives': true_positives,
@@ -726,6 +891,28 @@ def calculate_prediction_accuracy(user_predictions: dict, claim_audits: list) ->
     }
 
 
+def audit_status(checks: list) -> str:
+    """
+    Determine a claim's overall status from its checks.
+
+    Args:
+        checks: StatisticalCheck results for one claim
+
+    Returns:
+        ClaimAudit overall_status value
+    """
+    failed_checks = [c for c in checks if not c.passed]
+
+    if any(c.severity == "critical" for c in failed_checks):
+        return "critical"
+    elif any(c.severity == "high" for c in failed_checks):
+        return "major_issues"
+    elif failed_checks:
+        return "minor_issues"
+    else:
+        return "clean"
+
+
 def calculate_reliability_score(text_metrics: TextMetrics, claim_audits: list) -> float:
     """
     Calculate overall reliability score (0-100).
@@ -753,11 +940,11 @@ def calculate_reliability_score(text_metrics: TextMetrics, claim_audits: list) -
     score -= min(text_metrics.extreme_language_count * 2, 15)
 
     # Penalize for failed checks
-    total_checks = sum(len(audit.checks_performed) for audit in claim_audits)
-    failed_checks = sum(
-        len([c for c in audit.checks_performed if not c.passed])
-        for audit in claim_audits
-    )
+    total_checks = 0
+    failed_checks = 0
+    for audit in claim_audits:
+        total_checks += len(audit.checks_performed)
+        failed_checks += len(audit.failed_checks)
 
     if total_checks > 0:
         failure_rate = failed_checks / total_checks
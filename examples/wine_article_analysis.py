@@ -100,14 +100,9 @@ def test_wine_article():
 
     total_issues_found = 0
 
-    for claim_data in test_claims:
-        print(f"\n{'─' * 80}")
-        print(f"CLAIM {claim_data['id'].upper()}: \"{claim_data['quote']}\"")
-        print(f"Type: {claim_data['type']}")
-        print(f"{'─' * 80}")
-
-        # Create claim object
-        claim = Claim(
+    # Create claim objects
+    claims = [
+        Claim(
             claim_id=claim_data['id'],
             quote=claim_data['quote'],
             claim_type=claim_data['type'],
@@ -115,27 +110,42 @@ def test_wine_article():
             variables=[],
             numerical_values=[]
         )
+        for claim_data in test_claims
+    ]
+
+    # Run all checks
+    all_checks = [analyzer.check_claim(claim) for claim in claims]
+
+    severity_emoji = {
+        'high': '🔴',
+        'medium': '⚠️',
+        'low': '🟡'
+    }
+
+    for claim_data, checks in zip(test_claims, all_checks):
+        # Build each claim's report and write it in one call
+        lines = [
+            f"\n{'─' * 80}",
+            f"CLAIM {claim_data['id'].upper()}: \"{claim_data['quote']}\"",
+            f"Type: {claim_data['type']}",
+            f"{'─' * 80}"
+        ]
 
-        # Run all checks
-        checks = analyzer.check_claim(claim)
         failed_checks = [c for c in checks if not c.passed]
 
         if failed_checks:
-            print(f"\n❌ ISSUES FOUND: {len(failed_checks)}")
+            lines.append(f"\n❌ ISSUES FOUND: {len(failed_checks)}")
             total_issues_found += len(failed_checks)
 
             for check in failed_checks:
-                severity_emoji = {
-                    'high': '🔴',
-                    'medium': '⚠️',
-                    'low': '🟡'
-                }
-                print(f"\n  {severity_emoji.get(check.severity, '❓')} {check.check_name} [{check.severity.upper()}]")
-                print(f"     Problem: {check.explanation[:150]}...")
+                lines.append(f"\n  {severity_emoji.get(check.severity, '❓')} {check.check_name} [{check.severity.upper()}]")
+                lines.append(f"     Problem: {check.explanation[:150]}...")
                 if check.suggestion:
-                    print(f"     Fix: {check.suggestion[:100]}...")
+                    lines.append(f"     Fix: {check.suggestion[:100]}...")
         else:
-            print("\n✅ No issues found (clean claim)")
+            lines.append("\n✅ No issues found (clean claim)")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Summary
     print("\n" + "=" * 80)
@@ -5,37 +5,234 @@ This module handles all interactions with the Anthropic API, using
 strict schema validation and retry mechanisms.
 """
 
+import asyncio
+import json
 import os
-from typing import List
+import re
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional
 import anthropic
 from dotenv import load_dotenv
 
-from .schemas import ClaimsExtraction, Claim, ClaimAudit, StatisticalCheck
-from .retry import validate_with_retry
+from .schemas import ClaimsExtraction, Claim, ClaimAudit, CounterfactualsBatch, StatisticalCheck
+from .retry import validate_with_retry, avalidate_with_retry
+from .llm_cache import get_cache, prompt_hash
 
 # Load environment variables
 load_dotenv()
 
+# Numbered/bulleted list markers ("1.", "2)", "•", "-") in counterfactual responses
+_ALT_SPLIT_RE = re.compile(r'\n\s*[\d•\-\*]+[\.\)]\s*')
+_ALT_PREFIX_RE = re.compile(r'^\s*[\d•\-\*]+[\.\)]\s*')
+
+# Attempts the SDK makes on 429/5xx/connection errors, with exponential backoff
+MAX_RETRIES = 3
+
+# Sampling temperatures; responses sampled above 0 are only cached in memory
+SUMMARY_TEMPERATURE = 0.3
+COUNTERFACTUAL_TEMPERATURE = 0.7  # Slightly higher for creative alternatives
+
+class CounterfactualItem(NamedTuple):
+    """One flagged issue to generate counterfactuals for."""
+    fallacy_type: str
+    claim_quote: str
+    check_explanation: str
+
+
+# Sync SDK clients shared by every ClaudeClient using the same API key
+_CLIENT_CACHE: Dict[str, anthropic.Anthropic] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _shared_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Return the process-wide sync client for api_key, creating it on first use.
+
+    Reusing one client keeps its connection pool (and warm TLS sessions)
+    across short-lived ClaudeClient instances.
+    """
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = anthropic.Anthropic(api_key=api_key, max_retries=MAX_RETRIES)
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
+# Prompt templates, built once at import; the _build_*_prompt methods fill them in
+_EXTRACTION_INSTRUCTIONS = """You are a statistical reasoning auditor. Your job is to extract concrete, testable claims from text.
+
+Analyze the text above (inside the <text> tags) and extract ALL statistical, causal, comparative, or absolute claims.
+
+For each claim, identify:
+1. The exact quote from the text
+2. The type of claim (statistical/causal/comparative/absolute)
+3. Any variables or factors mentioned
+4. Any numerical values, percentages, or statistics
+
+IMPORTANT INSTRUCTIONS:
+- Extract ONLY claims that make factual assertions
+- Do NOT extract opinions or subjective statements
+- Do NOT extract the same claim multiple times (no duplicates)
+- Include the exact quote from the original text
+- Assign sequential IDs: c1, c2, c3, etc.
+- Be thorough but precise
+
+Output your response as JSON matching this exact schema:
+
+{
+    "claims": [
+        {
+            "claim_id": "c1",
+            "quote": "exact quote from text",
+            "claim_type": "statistical" | "causal" | "comparative" | "absolute",
+            "confidence": 0.0 to 1.0,
+            "variables": ["variable1", "variable2"],
+            "numerical_values": ["50%", "1000", "3x"]
+        }
+    ],
+    "total_claims": number_of_claims
+}
+
+Output ONLY the JSON, with no additional text or explanation."""
+
+_SUMMARY_TEMPLATE = """You are a statistical reasoning educator. Your job is to explain audit findings in a clear, educational way.
+
+The original text is shown above (inside the <text> tags).
+
+QUANTITATIVE ANALYSIS:
+- Data density: {density:.1%} of sentences contain numbers/statistics
+- Vagueness score: {vagueness:.1%} (higher = more hedge words)
+- Extreme language: {extreme} instances of absolute terms
+- Sample size mentioned: {sample_mentioned}
+- Causation language: {causation} instances without evidence
+
+CLAIM-BY-CLAIM AUDIT RESULTS:
+{audits_text}
+
+Your task: Write a clear, educational summary (200-300 words) that:
+
+1. Starts with an overall assessment (is this text data-driven or hand-wavy?)
+2. Highlights the 2-3 most important issues found
+3. Explains WHY each issue is problematic (teach statistical reasoning)
+4. Keeps a balanced tone (not preachy, but informative)
+
+Focus on being helpful, not judgmental. The goal is to train the reader's "bullshit detector."
+
+Write your summary now:"""
+
+_COUNTERFACTUAL_TEMPLATE = """You are teaching critical thinking. A claim has a logical issue.
+
+Claim: "{claim_quote}"
+
+Issue: {fallacy_type}
+Why it's problematic: {check_explanation}
+
+{focus}
+
+Generate 3-4 concise alternative explanations (each 1-2 sentences). Format as a numbered list:
+
+1. [First alternative explanation]
+2. [Second alternative explanation]
+3. [Third alternative explanation]
+4. [Fourth alternative explanation]
+
+Be specific and educational. Help the reader think deeper about this claim."""
+
+_COUNTERFACTUAL_BATCH_TEMPLATE = """You are teaching critical thinking. Several claims have logical issues.
+
+{issues_text}
+
+For EACH issue above, generate 3-4 concise alternative explanations (each 1-2 sentences).
+Be specific and educational. Help the reader think deeper about each claim.
+
+Output your response as JSON matching this exact schema:
+
+{{
+    "counterfactuals": [
+        {{
+            "fallacy_type": "issue name exactly as given above",
+            "alternatives": ["first alternative", "second alternative", "third alternative"]
+        }}
+    ]
+}}
+
+Output ONLY the JSON, with no additional text or explanation."""
+
+# Thinking prompts for counterfactuals, by fallacy type
+_CORRELATION_FOCUS = """
+Think like a skeptical scientist. What are alternative explanations for this correlation?
+Consider:
+- Confounding variables (what else might cause both?)
+- Reverse causation (does B actually cause A instead?)
+- Selection bias (who was studied?)
+- Spurious correlation (coincidence?)"""
+
+_SAMPLE_FOCUS = """
+Think about sample size issues. What could go wrong with small or biased samples?
+Consider:
+- Statistical noise and random variation
+- Non-representative samples
+- Cherry-picked data
+- Publication bias"""
+
+_EXTREME_FOCUS = """
+Think about exceptions and edge cases. Why is absolute language problematic?
+Consider:
+- Edge cases and exceptions
+- Context-dependent situations
+- Individual variation
+- Time-dependent factors"""
+
+_BASE_RATE_FOCUS = """
+Think about missing context. What information would change the interpretation?
+Consider:
+- Absolute numbers vs percentages
+- Starting baseline
+- Comparison groups
+- Historical context"""
+
+_DEFAULT_FOCUS = """
+Think critically about what might be wrong or missing in this reasoning.
+Consider alternative explanations, missing information, and potential biases."""
+
+# One scan of the fallacy type picks its focus block
+_FOCUS_RE = re.compile(r'(correlation|causation|sample|extreme|absolute|base rate)', re.IGNORECASE)
+_FOCUS_MAP = {
+    'correlation': _CORRELATION_FOCUS,
+    'causation': _CORRELATION_FOCUS,
+    'sample': _SAMPLE_FOCUS,
+    'extreme': _EXTREME_FOCUS,
+    'absolute': _EXTREME_FOCUS,
+    'base rate': _BASE_RATE_FOCUS
+}
+
+
 
 class ClaudeClient:
     """
     Client for interacting with Claude API with built-in validation.
     """
 
-    def __init__(self, api_key: str = None, model: str = "claude-sonnet-4-5-20250929"):
+    def __init__(self, api_key: str = None, model: str = "claude-sonnet-4-5-20250929", use_cache: bool = True):
         """
         Initialize Claude client.
 
         Args:
             api_key: Anthropic API key (if None, reads from ANTHROPIC_API_KEY env var)
             model: Model to use for generation
+            use_cache: Serve repeated prompts from the shared response cache (see llm_cache)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment or arguments")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _shared_client(self.api_key)
+        # The async client's connections are tied to the event loop that first uses
+        # them, so it stays per instance rather than shared across loops
+        self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key, max_retries=MAX_RETRIES)
         self.model = model
+        self.cache = get_cache() if use_cache else None
 
     def extract_claims(self, text: str) -> ClaimsExtraction:
         """
@@ -50,22 +247,60 @@ class ClaudeClient:
             ClaimsExtraction with validated claims (deduplicated)
         """
         prompt = self._build_extraction_prompt(text)
+        cache_key = self._cache_key("extract_claims", prompt)
+        cached = self._cache_get(cache_key)
 
-        messages = [{"role": "user", "content": prompt}]
+        if cached is not None:
+            extraction = ClaimsExtraction.model_validate_json(cached)
+        else:
+            messages = [{"role": "user", "content": prompt}]
 
-        extraction = validate_with_retry(
-            client=self.client,
-            model=self.model,
-            initial_messages=messages,
-            schema_class=ClaimsExtraction,
-            max_retries=3
-        )
+            extraction = validate_with_retry(
+                client=self.client,
+                model=self.model,
+                initial_messages=messages,
+                schema_class=ClaimsExtraction,
+                max_retries=3
+            )
+            self._cache_set(cache_key, extraction.model_dump_json())
 
         # Deduplicate claims based on quote similarity
         extraction = self._deduplicate_claims(extraction)
 
         return extraction
 
+    async def aextract_claims(self, text: str) -> ClaimsExtraction:
+        """
+        Async variant of extract_claims.
+
+        Lets callers do local work (e.g. text metrics) while Claude is busy.
+
+        Args:
+            text: Input text to analyze
+
+        Returns:
+            ClaimsExtraction with validated claims (deduplicated)
+        """
+        prompt = self._build_extraction_prompt(text)
+        cache_key = self._cache_key("extract_claims", prompt)
+        cached = self._cache_get(cache_key)
+
+        if cached is not None:
+            extraction = ClaimsExtraction.model_validate_json(cached)
+        else:
+            messages = [{"role": "user", "content": prompt}]
+
+            extraction = await avalidate_with_retry(
+                client=self.async_client,
+                model=self.model,
+                initial_messages=messages,
+                schema_class=ClaimsExtraction,
+                max_retries=3
+            )
+            self._cache_set(cache_key, extraction.model_dump_json())
+
+        return self._deduplicate_claims(extraction)
+
     def _deduplicate_claims(self, extraction: ClaimsExtraction) -> ClaimsExtraction:
         """
         Remove duplicate claims based on quote similarity.
@@ -88,9 +323,12 @@ class ClaudeClient:
                 seen_quotes.add(normalized_quote)
                 unique_claims.append(claim)
 
-        # Resequence claim IDs to be consecutive (c1, c2, c3, ...)
-        for i, claim in enumerate(unique_claims, start=1):
-            claim.claim_id = f"c{i}"
+        # Resequence claim IDs to be consecutive (c1, c2, c3, ...); claims are
+        # frozen, so renumbered ones are copies
+        unique_claims = [
+            claim if claim.claim_id == f"c{i}" else claim.model_copy(update={"claim_id": f"c{i}"})
+            for i, claim in enumerate(unique_claims, start=1)
+        ]
 
         # Return new ClaimsExtraction with updated count
         return ClaimsExtraction(
@@ -116,15 +354,92 @@ class ClaudeClient:
             Plain-language explanation of findings
         """
         prompt = self._build_summary_prompt(original_text, claim_audits, text_metrics)
+        cache_key = self._cache_key("audit_summary", prompt, SUMMARY_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         response = self.client.messages.create(
             model=self.model,
             max_tokens=2048,
-            temperature=0.3,
+            temperature=SUMMARY_TEMPERATURE,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        summary = response.content[0].text
+        self._cache_set(cache_key, summary, SUMMARY_TEMPERATURE)
+        return summary
+
+    def stream_audit_summary(
+        self,
+        original_text: str,
+        claim_audits: List[ClaimAudit],
+        text_metrics: dict
+    ) -> Iterator[str]:
+        """
+        Streaming variant of generate_audit_summary.
+
+        Args:
+            original_text: The original text that was analyzed
+            claim_audits: List of audit results for each claim
+            text_metrics: Dictionary of quantitative metrics
+
+        Yields:
+            Chunks of the plain-language explanation as they are generated
+        """
+        prompt = self._build_summary_prompt(original_text, claim_audits, text_metrics)
+        cache_key = self._cache_key("audit_summary", prompt, SUMMARY_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=2048,
+            temperature=SUMMARY_TEMPERATURE,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for chunk in stream.text_stream:
+                chunks.append(chunk)
+                yield chunk
+
+        self._cache_set(cache_key, "".join(chunks), SUMMARY_TEMPERATURE)
+
+    async def agenerate_audit_summary(
+        self,
+        original_text: str,
+        claim_audits: List[ClaimAudit],
+        text_metrics: dict
+    ) -> str:
+        """
+        Async variant of generate_audit_summary.
+
+        Args:
+            original_text: The original text that was analyzed
+            claim_audits: List of audit results for each claim
+            text_metrics: Dictionary of quantitative metrics
+
+        Returns:
+            Plain-language explanation of findings
+        """
+        prompt = self._build_summary_prompt(original_text, claim_audits, text_metrics)
+        cache_key = self._cache_key("audit_summary", prompt, SUMMARY_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=2048,
+            temperature=SUMMARY_TEMPERATURE,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        return response.content[0].text
+        summary = response.content[0].text
+        self._cache_set(cache_key, summary, SUMMARY_TEMPERATURE)
+        return summary
 
     def generate_counterfactuals(
         self,
@@ -147,120 +462,230 @@ class ClaudeClient:
             List of 3-4 alternative explanations
         """
         prompt = self._build_counterfactual_prompt(claim_quote, fallacy_type, check_explanation)
+        cache_key = self._cache_key("counterfactuals", prompt, COUNTERFACTUAL_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
 
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1024,
-            temperature=0.7,  # Slightly higher for creative alternatives
+            temperature=COUNTERFACTUAL_TEMPERATURE,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        # Parse response into list of alternatives
-        response_text = response.content[0].text.strip()
+        alternatives = self._parse_alternatives(response.content[0].text)
+        self._cache_set(cache_key, json.dumps(alternatives), COUNTERFACTUAL_TEMPERATURE)
+        return alternatives
+
+    async def agenerate_counterfactuals(
+        self,
+        claim_quote: str,
+        fallacy_type: str,
+        check_explanation: str
+    ) -> List[str]:
+        """
+        Async variant of generate_counterfactuals.
+
+        Args:
+            claim_quote: The problematic claim
+            fallacy_type: Type of logical error (e.g., "Correlation vs Causation")
+            check_explanation: Why this is problematic
 
-        # Split by numbered lines (1., 2., 3., etc.) or bullet points
-        import re
-        alternatives = re.split(r'\n\s*[\d•\-\*]+[\.\)]\s*', response_text)
+        Returns:
+            List of 3-4 alternative explanations
+        """
+        prompt = self._build_counterfactual_prompt(claim_quote, fallacy_type, check_explanation)
+        cache_key = self._cache_key("counterfactuals", prompt, COUNTERFACTUAL_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
 
-        # Clean up and filter
-        alternatives = [alt.strip() for alt in alternatives if alt.strip()]
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=1024,
+            temperature=COUNTERFACTUAL_TEMPERATURE,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        alternatives = self._parse_alternatives(response.content[0].text)
+        self._cache_set(cache_key, json.dumps(alternatives), COUNTERFACTUAL_TEMPERATURE)
+        return alternatives
 
-        # Remove any leading number patterns (e.g., "1.", "2)", etc.) from each alternative
-        alternatives = [re.sub(r'^\s*[\d•\-\*]+[\.\)]\s*', '', alt) for alt in alternatives]
+    @staticmethod
+    def _parse_alternatives(response_text: str) -> List[str]:
+        """Parse a numbered/bulleted counterfactual response into up to 4 alternatives."""
+        response_text = response_text.strip()
+
+        # Split by numbered lines (1., 2., 3., etc.) or bullet points, then strip each
+        # piece once, drop empties and remove any leading number pattern ("1.", "2)")
+        alternatives = [
+            _ALT_PREFIX_RE.sub('', alt)
+            for alt in (piece.strip() for piece in _ALT_SPLIT_RE.split(response_text))
+            if alt
+        ]
 
         # If parsing failed, try splitting by newlines
         if len(alternatives) < 2:
-            alternatives = [line.strip() for line in response_text.split('\n') if line.strip()]
-            # Remove numbering from newline-split alternatives too
-            alternatives = [re.sub(r'^\s*[\d•\-\*]+[\.\)]\s*', '', alt) for alt in alternatives]
+            alternatives = [
+                _ALT_PREFIX_RE.sub('', line)
+                for line in (raw.strip() for raw in response_text.split('\n'))
+                if line
+            ]
 
         # Return up to 4 alternatives
         return alternatives[:4]
 
-    def _build_extraction_prompt(self, text: str) -> str:
-        """Build prompt for claim extraction."""
-        return f"""You are a statistical reasoning auditor. Your job is to extract concrete, testable claims from text.
+    def generate_counterfactuals_batch(
+        self,
+        items: List[CounterfactualItem]
+    ) -> Dict[str, List[str]]:
+        """
+        Generate alternative explanations for several issues in one Claude call.
 
-Analyze this text and extract ALL statistical, causal, comparative, or absolute claims:
+        Args:
+            items: Issues to cover, as CounterfactualItem(fallacy_type, claim_quote, check_explanation)
 
-<text>
-{text}
-</text>
+        Returns:
+            Dict mapping fallacy_type to up to 4 alternative explanations
+        """
+        if not items:
+            return {}
 
-For each claim, identify:
-1. The exact quote from the text
-2. The type of claim (statistical/causal/comparative/absolute)
-3. Any variables or factors mentioned
-4. Any numerical values, percentages, or statistics
+        prompt = self._build_counterfactual_batch_prompt(items)
+        cache_key = self._cache_key("counterfactuals_batch", prompt, COUNTERFACTUAL_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
 
-IMPORTANT INSTRUCTIONS:
-- Extract ONLY claims that make factual assertions
-- Do NOT extract opinions or subjective statements
-- Do NOT extract the same claim multiple times (no duplicates)
-- Include the exact quote from the original text
-- Assign sequential IDs: c1, c2, c3, etc.
-- Be thorough but precise
+        batch = validate_with_retry(
+            client=self.client,
+            model=self.model,
+            initial_messages=[{"role": "user", "content": prompt}],
+            schema_class=CounterfactualsBatch,
+            max_retries=3,
+            temperature=COUNTERFACTUAL_TEMPERATURE
+        )
 
-Output your response as JSON matching this exact schema:
+        counterfactuals = {
+            entry.fallacy_type: entry.alternatives[:4]
+            for entry in batch.counterfactuals
+        }
+        self._cache_set(cache_key, json.dumps(counterfactuals), COUNTERFACTUAL_TEMPERATURE)
+        return counterfactuals
 
-{{
-    "claims": [
-        {{
-            "claim_id": "c1",
-            "quote": "exact quote from text",
-            "claim_type": "statistical" | "causal" | "comparative" | "absolute",
-            "confidence": 0.0 to 1.0,
-            "variables": ["variable1", "variable2"],
-            "numerical_values": ["50%", "1000", "3x"]
-        }}
-    ],
-    "total_claims": number_of_claims
-}}
+    async def agenerate_counterfactuals_batch(
+        self,
+        items: List[CounterfactualItem]
+    ) -> Dict[str, List[str]]:
+        """
+        Async variant of generate_counterfactuals_batch.
 
-Output ONLY the JSON, with no additional text or explanation."""
+        Args:
+            items: Issues to cover, as CounterfactualItem(fallacy_type, claim_quote, check_explanation)
 
-    def _build_summary_prompt(
-        self,
-        original_text: str,
-        claim_audits: List[ClaimAudit],
-        text_metrics: dict
-    ) -> str:
-        """Build prompt for generating audit summary."""
+        Returns:
+            Dict mapping fallacy_type to up to 4 alternative explanations
+        """
+        if not items:
+            return {}
 
-        # Format claim audits for context
-        audits_text = "\n\n".join([
-            f"Claim {audit.claim_id}: \"{audit.claim_quote}\"\n"
-            f"Status: {audit.overall_status}\n"
-            f"Issues found: {len([c for c in audit.checks_performed if not c.passed])}\n"
-            f"Details: {', '.join([c.explanation for c in audit.checks_performed if not c.passed])}"
-            for audit in claim_audits
-        ])
+        prompt = self._build_counterfactual_batch_prompt(items)
+        cache_key = self._cache_key("counterfactuals_batch", prompt, COUNTERFACTUAL_TEMPERATURE)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
 
-        return f"""You are a statistical reasoning educator. Your job is to explain audit findings in a clear, educational way.
+        batch = await avalidate_with_retry(
+            client=self.async_client,
+            model=self.model,
+            initial_messages=[{"role": "user", "content": prompt}],
+            schema_class=CounterfactualsBatch,
+            max_retries=3,
+            temperature=COUNTERFACTUAL_TEMPERATURE
+        )
 
-ORIGINAL TEXT:
-{original_text}
+        counterfactuals = {
+            entry.fallacy_type: entry.alternatives[:4]
+            for entry in batch.counterfactuals
+        }
+        self._cache_set(cache_key, json.dumps(counterfactuals), COUNTERFACTUAL_TEMPERATURE)
+        return counterfactuals
 
-QUANTITATIVE ANALYSIS:
-- Data density: {text_metrics.get('data_density_score', 0):.1%} of sentences contain numbers/statistics
-- Vagueness score: {text_metrics.get('vagueness_score', 0):.1%} (higher = more hedge words)
-- Extreme language: {text_metrics.get('extreme_language_count', 0)} instances of absolute terms
-- Sample size mentioned: {text_metrics.get('sample_size_mentioned', False)}
-- Causation language: {text_metrics.get('causation_language_count', 0)} instances without evidence
+    def _cache_key(self, kind: str, prompt, temperature: float = 0.0) -> Optional[str]:
+        """Response-cache key for a prompt and temperature, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return prompt_hash(self.model, [kind, temperature, prompt])
 
-CLAIM-BY-CLAIM AUDIT RESULTS:
-{audits_text}
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        """Cached response for key, or None on a miss / disabled cache."""
+        return self.cache.get(key) if key is not None else None
 
-Your task: Write a clear, educational summary (200-300 words) that:
+    def _cache_set(self, key: Optional[str], value: str, temperature: float = 0.0) -> None:
+        """
+        Store a response if caching is enabled.
 
-1. Starts with an overall assessment (is this text data-driven or hand-wavy?)
-2. Highlights the 2-3 most important issues found
-3. Explains WHY each issue is problematic (teach statistical reasoning)
-4. Keeps a balanced tone (not preachy, but informative)
+        Sampled responses (temperature > 0) stay in memory only, so a new
+        process can draw fresh ones instead of replaying a stored sample.
+        """
+        if key is not None:
+            self.cache.set(key, value, persist=temperature == 0)
 
-Focus on being helpful, not judgmental. The goal is to train the reader's "bullshit detector."
+    def _article_block(self, text: str) -> dict:
+        """
+        Leading content block holding the article, marked for prompt caching.
 
-Write your summary now:"""
+        Extraction and summary prompts both start with this exact block, so the
+        later call reads the article from Anthropic's prompt cache.
+        """
+        return {
+            "type": "text",
+            "text": f"<text>\n{text}\n</text>",
+            "cache_control": {"type": "ephemeral"}
+        }
+
+    def _build_extraction_prompt(self, text: str) -> List[dict]:
+        """Build prompt content blocks for claim extraction."""
+        return [self._article_block(text), {"type": "text", "text": _EXTRACTION_INSTRUCTIONS}]
+
+    def _build_summary_prompt(
+        self,
+        original_text: str,
+        claim_audits: List[ClaimAudit],
+        text_metrics: dict
+    ) -> List[dict]:
+        """Build prompt content blocks for generating audit summary."""
+
+        # Format claim audits for context
+        parts = []
+        for audit in claim_audits:
+            failed = audit.failed_checks
+            parts.append(
+                f"Claim {audit.claim_id}: \"{audit.claim_quote}\"\n"
+                f"Status: {audit.overall_status}\n"
+                f"Issues found: {len(failed)}\n"
+                f"Details: {', '.join(c.explanation for c in failed)}"
+            )
+        audits_text = "\n\n".join(parts)
+
+        get = text_metrics.get
+        density = get('data_density_score', 0)
+        vagueness = get('vagueness_score', 0)
+        extreme = get('extreme_language_count', 0)
+        sample_mentioned = get('sample_size_mentioned', False)
+        causation = get('causation_language_count', 0)
+
+        instructions = _SUMMARY_TEMPLATE.format(
+            density=density,
+            vagueness=vagueness,
+            extreme=extreme,
+            sample_mentioned=sample_mentioned,
+            causation=causation,
+            audits_text=audits_text
+        )
+
+        return [self._article_block(original_text), {"type": "text", "text": instructions}]
 
     def _build_counterfactual_prompt(
         self,
@@ -269,66 +694,31 @@ Write your summary now:"""
         check_explanation: str
     ) -> str:
         """Build prompt for generating counterfactual explanations."""
+        focus = self._counterfactual_focus(fallacy_type)
 
-        # Customize prompts based on fallacy type
-        if "correlation" in fallacy_type.lower() or "causation" in fallacy_type.lower():
-            focus = """
-Think like a skeptical scientist. What are alternative explanations for this correlation?
-Consider:
-- Confounding variables (what else might cause both?)
-- Reverse causation (does B actually cause A instead?)
-- Selection bias (who was studied?)
-- Spurious correlation (coincidence?)"""
-
-        elif "sample" in fallacy_type.lower():
-            focus = """
-Think about sample size issues. What could go wrong with small or biased samples?
-Consider:
-- Statistical noise and random variation
-- Non-representative samples
-- Cherry-picked data
-- Publication bias"""
-
-        elif "extreme" in fallacy_type.lower() or "absolute" in fallacy_type.lower():
-            focus = """
-Think about exceptions and edge cases. Why is absolute language problematic?
-Consider:
-- Edge cases and exceptions
-- Context-dependent situations
-- Individual variation
-- Time-dependent factors"""
-
-        elif "base rate" in fallacy_type.lower():
-            focus = """
-Think about missing context. What information would change the interpretation?
-Consider:
-- Absolute numbers vs percentages
-- Starting baseline
-- Comparison groups
-- Historical context"""
-
-        else:
-            focus = """
-Think critically about what might be wrong or missing in this reasoning.
-Consider alternative explanations, missing information, and potential biases."""
-
-        return f"""You are teaching critical thinking. A claim has a logical issue.
-
-Claim: "{claim_quote}"
-
-Issue: {fallacy_type}
-Why it's problematic: {check_explanation}
-
-{focus}
+        return _COUNTERFACTUAL_TEMPLATE.format(
+            claim_quote=claim_quote,
+            fallacy_type=fallacy_type,
+            check_explanation=check_explanation,
+            focus=focus
+        )
 
-Generate 3-4 concise alternative explanations (each 1-2 sentences). Format as a numbered list:
+    def _build_counterfactual_batch_prompt(self, items: List[CounterfactualItem]) -> str:
+        """Build a single prompt covering several flagged issues."""
+        issues_text = "\n\n".join(
+            f"Issue: {item.fallacy_type}\n"
+            f"Claim: \"{item.claim_quote}\"\n"
+            f"Why it's problematic: {item.check_explanation}\n"
+            f"{self._counterfactual_focus(item.fallacy_type)}"
+            for item in items
+        )
 
-1. [First alternative explanation]
-2. [Second alternative explanation]
-3. [Third alternative explanation]
-4. [Fourth alternative explanation]
+        return _COUNTERFACTUAL_BATCH_TEMPLATE.format(issues_text=issues_text)
 
-Be specific and educational. Help the reader think deeper about this claim."""
+    def _counterfactual_focus(self, fallacy_type: str) -> str:
+        """Pick the thinking prompt that fits the fallacy type."""
+        match = _FOCUS_RE.search(fallacy_type)
+        return _FOCUS_MAP[match.group(1).lower()] if match else _DEFAULT_FOCUS
 
 
 def get_client() -> ClaudeClient:
@@ -336,3 +726,27 @@ def get_client() -> ClaudeClient:
     Convenience function to get a configured Claude client.
     """
     return ClaudeClient()
+
+
+async def batch_counterfactuals(
+    client: ClaudeClient,
+    items: List[CounterfactualItem]
+) -> List[List[str]]:
+    """
+    Generate counterfactuals for several claims concurrently.
+
+    Args:
+        client: Configured Claude client
+        items: Issues to cover, as CounterfactualItem(fallacy_type, claim_quote, check_explanation)
+
+    Returns:
+        Alternatives for each item, in the same order as items
+    """
+    return await asyncio.gather(*[
+        client.agenerate_counterfactuals(
+            claim_quote=item.claim_quote,
+            fallacy_type=item.fallacy_type,
+            check_explanation=item.check_explanation
+        )
+        for item in items
+    ])
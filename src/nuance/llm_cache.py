@@ -0,0 +1,178 @@
+"""
+Content-addressed cache for Claude responses.
+
+Identical prompts (re-running the same article, demo reruns) are served
+from an in-process LRU, so they skip the API and its token cost entirely.
+Entries are keyed by sha256(model + prompt).
+
+Responses contain text from the user's articles, so nothing is written to
+disk unless NUANCE_LLM_CACHE names a SQLite file. That persistent layer is
+bounded by a row cap and a TTL.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+
+DEFAULT_MAX_ROWS = 10_000
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def prompt_hash(model: str, prompt: Union[str, list]) -> str:
+    """
+    Hash a model name and prompt into a cache key.
+
+    Args:
+        model: Model the prompt is sent to
+        prompt: Prompt string or list of content blocks
+
+    Returns:
+        Hex sha256 digest
+    """
+    if not isinstance(prompt, str):
+        prompt = json.dumps(prompt, sort_keys=True)
+    return hashlib.sha256((model + prompt).encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    Response cache: an in-memory LRU, optionally in front of a SQLite file.
+
+    Safe to share between threads. SQLite errors (an unopenable path, another
+    process holding the lock) never reach the caller: a failed read is a miss
+    and a failed write is skipped.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        maxsize: int = 512,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent layer (None for memory-only)
+            maxsize: Number of entries kept in memory
+            max_rows: Most rows kept in the SQLite file; oldest are evicted first
+            ttl_seconds: Age after which SQLite rows are ignored and purged
+        """
+        self.maxsize = maxsize
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path is not None:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(path), check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+                )
+                self._db.execute(
+                    "DELETE FROM llm_responses WHERE created < ?", (time.time() - ttl_seconds,)
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error):
+                self._db = None
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            if self._db is None:
+                return None
+
+            try:
+                row = self._db.execute(
+                    "SELECT value FROM llm_responses WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.ttl_seconds)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+
+            if row is None:
+                return None
+
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, value: str, persist: bool = True) -> None:
+        """
+        Store a response under key.
+
+        Args:
+            key: Cache key from prompt_hash
+            value: Response text
+            persist: Also write to the SQLite layer (False keeps it in memory only)
+        """
+        with self._lock:
+            self._remember(key, value)
+
+            if self._db is None or not persist:
+                return
+
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                self._db.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY created DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.max_rows,)
+                )
+                self._db.commit()
+            except sqlite3.Error:
+                try:
+                    self._db.rollback()
+                except sqlite3.Error:
+                    pass
+
+    def _remember(self, key: str, value: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[LLMCache]:
+    """
+    Shared process-wide cache.
+
+    Memory-only by default. Set NUANCE_LLM_CACHE to a file path to also
+    persist responses in SQLite, or to "off" to disable caching entirely.
+
+    Returns:
+        The shared LLMCache, or None if caching is disabled
+    """
+    global _default_cache
+
+    setting = os.getenv("NUANCE_LLM_CACHE", "")
+    if setting.lower() == "off":
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache(Path(setting).expanduser() if setting else None)
+        return _default_cache
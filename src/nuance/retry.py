@@ -7,13 +7,18 @@ we feed the error message back to Claude and ask it to fix the JSON.
 This is the "Guardrails" pattern that significantly reduces parsing errors.
 """
 
-import json
-from typing import TypeVar, Type, Callable, Any
-from pydantic import BaseModel, ValidationError
+import functools
+import re
+from typing import Optional, Tuple, TypeVar, Type, Callable, Any
+from pydantic import BaseModel, TypeAdapter, ValidationError
 import anthropic
 
 T = TypeVar('T', bound=BaseModel)
 
+# Markdown code fence (```json ... ``` or ``` ... ```) around Claude's JSON;
+# a fence cut off by max_tokens runs to the end of the text
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)(?:```|$)", re.DOTALL)
+
 
 class RetryExhaustedError(Exception):
     """Raised when max retries are exceeded without successful validation."""
@@ -51,55 +56,132 @@ def validate_with_retry(
     Raises:
         RetryExhaustedError: If validation fails after max_retries attempts
     """
-    messages = initial_messages.copy()
-    last_error = None
+    messages = initial_messages
+
+    for attempt in range(max_retries + 1):
+        # Call Claude, collecting text as it streams in
+        chunks = []
+        with client.messages.stream(
+            model=model,
+            max_tokens=4096,
+            temperature=temperature,
+            messages=messages
+        ) as stream:
+            for chunk in stream.text_stream:
+                chunks.append(chunk)
+
+        result, messages = _handle_attempt(
+            "".join(chunks), schema_class, initial_messages, attempt, max_retries
+        )
+        if result is not None:
+            return result
+
+    # Only reachable when max_retries is negative
+    raise RetryExhaustedError(f"No attempts made for {schema_class.__name__} (max_retries={max_retries})")
+
+
+async def avalidate_with_retry(
+    client: anthropic.AsyncAnthropic,
+    model: str,
+    initial_messages: list,
+    schema_class: Type[T],
+    max_retries: int = 3,
+    temperature: float = 0.0
+) -> T:
+    """
+    Async variant of validate_with_retry for use with anthropic.AsyncAnthropic.
+
+    Same retry semantics; awaiting the API call lets callers overlap Claude
+    latency with other work.
+    """
+    messages = initial_messages
 
     for attempt in range(max_retries + 1):
-        try:
-            # Call Claude
-            response = client.messages.create(
-                model=model,
-                max_tokens=4096,
-                temperature=temperature,
-                messages=messages
-            )
-
-            # Extract text content
-            response_text = response.content[0].text
-
-            # Try to parse JSON from response
-            # Handle cases where Claude wraps JSON in markdown code blocks
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-
-            # Parse JSON
-            data = json.loads(json_str)
-
-            # Validate with Pydantic
-            validated_data = schema_class.model_validate(data)
-
-            # Success!
-            return validated_data
-
-        except (json.JSONDecodeError, ValidationError) as e:
-            last_error = e
-            error_type = "JSON parsing" if isinstance(e, json.JSONDecodeError) else "Schema validation"
-
-            if attempt < max_retries:
-                # Prepare retry message with error feedback
-                error_message = f"""
+        chunks = []
+        async with client.messages.stream(
+            model=model,
+            max_tokens=4096,
+            temperature=temperature,
+            messages=messages
+        ) as stream:
+            async for chunk in stream.text_stream:
+                chunks.append(chunk)
+
+        result, messages = _handle_attempt(
+            "".join(chunks), schema_class, initial_messages, attempt, max_retries
+        )
+        if result is not None:
+            return result
+
+    raise RetryExhaustedError(f"No attempts made for {schema_class.__name__} (max_retries={max_retries})")
+
+
+def _handle_attempt(
+    response_text: str,
+    schema_class: Type[T],
+    initial_messages: list,
+    attempt: int,
+    max_retries: int
+) -> Tuple[Optional[T], list]:
+    """
+    Validate one response and decide what the retry loop does next.
+
+    Shared by the sync and async loops, which differ only in how they call Claude.
+
+    Returns:
+        (result, messages): the validated result and None on success, or None
+        and the messages for the next attempt on failure
+
+    Raises:
+        RetryExhaustedError: If this was the last allowed attempt
+    """
+    try:
+        return _parse_response(response_text, schema_class), None
+    except ValidationError as e:
+        if attempt >= max_retries:
+            raise RetryExhaustedError(
+                f"Failed to get valid {schema_class.__name__} after {max_retries + 1} attempts. "
+                f"Last error: {str(e)}"
+            ) from e
+
+        # Resend only the original prompt plus the latest failed response and
+        # its error feedback, so payloads don't grow with each attempt
+        return None, initial_messages + _retry_messages(response_text, e, schema_class)
+
+
+def _parse_response(response_text: str, schema_class: Type[T]) -> T:
+    """
+    Parse and validate Claude's raw response text against the schema.
+
+    Raises ValidationError (malformed JSON included) so the caller can retry.
+    """
+    # Handle cases where Claude wraps JSON in markdown code blocks
+    json_str = extract_json_from_text(response_text)
+
+    # Parse and validate in one pass with Pydantic's JSON parser
+    return _type_adapter(schema_class).validate_json(json_str)
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(schema_class: Type[T]) -> TypeAdapter:
+    """Build each schema's TypeAdapter once and reuse it across calls."""
+    return TypeAdapter(schema_class)
+
+
+def _retry_messages(response_text: str, error: ValidationError, schema_class: Type[T]) -> list:
+    """Build the assistant/user message pair that asks Claude to fix its output."""
+    # Pydantic reports malformed JSON as a json_invalid validation error
+    if any(e["type"] == "json_invalid" for e in error.errors()):
+        error_type = "JSON parsing"
+    else:
+        error_type = "Schema validation"
+
+    # Prepare retry message with error feedback
+    error_message = f"""
 {error_type} error occurred. Please fix the JSON and try again.
 
 Error details:
-{str(e)}
+{str(error)}
 
 Requirements:
 1. Your response must be valid JSON
@@ -110,21 +192,10 @@ Requirements:
 
 Please output ONLY the corrected JSON, with no additional text or explanation.
 """
-                # Add the assistant's failed response and our error feedback
-                messages.extend([
-                    {"role": "assistant", "content": response_text if 'response_text' in locals() else ""},
-                    {"role": "user", "content": error_message}
-                ])
-
-            else:
-                # Max retries exceeded
-                raise RetryExhaustedError(
-                    f"Failed to get valid {schema_class.__name__} after {max_retries + 1} attempts. "
-                    f"Last error: {str(last_error)}"
-                )
-
-    # Should never reach here, but just in case
-    raise RetryExhaustedError(f"Unexpected error in retry loop. Last error: {str(last_error)}")
+    return [
+        {"role": "assistant", "content": response_text},
+        {"role": "user", "content": error_message}
+    ]
 
 
 def extract_json_from_text(text: str) -> str:
@@ -132,20 +203,5 @@ def extract_json_from_text(text: str) -> str:
     Helper function to extract JSON from Claude's response.
     Handles cases where JSON is wrapped in markdown code blocks.
     """
-    text = text.strip()
-
-    # Case 1: Wrapped in ```json ... ```
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        return text[start:end].strip()
-
-    # Case 2: Wrapped in ``` ... ``` (generic code block)
-    elif "```" in text:
-        start = text.find("```") + 3
-        end = text.find("```", start)
-        return text[start:end].strip()
-
-    # Case 3: Raw JSON
-    else:
-        return text
+    match = _FENCE_RE.search(text)
+    return (match.group(1) if match else text).strip()
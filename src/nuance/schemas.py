@@ -1,10 +1,19 @@
 """
 Pydantic schemas for strict validation of LLM outputs.
 This is the "Guardrails" layer that prevents hallucinated/malformed data.
+
+All models are immutable and build their validators on first use rather than
+at import. Models only ever built by our own code also reject unknown fields;
+the ones parsed from Claude ignore stray keys so they don't cost a retry.
 """
 
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import FrozenSet, List, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+_LLM_CONFIG = ConfigDict(frozen=True, defer_build=True)
+_INTERNAL_CONFIG = ConfigDict(frozen=True, defer_build=True, extra='forbid')
 
 
 class Claim(BaseModel):
@@ -14,6 +23,8 @@ class Claim(BaseModel):
     This schema enforces strict structure on LLM outputs, enabling
     deterministic validation and retry mechanisms.
     """
+    model_config = _LLM_CONFIG
+
     claim_id: str = Field(..., description="Unique identifier for this claim (e.g., 'c1', 'c2')")
     quote: str = Field(..., min_length=5, description="Exact quote from the original text")
     claim_type: Literal["statistical", "causal", "comparative", "absolute"] = Field(
@@ -42,21 +53,43 @@ class ClaimsExtraction(BaseModel):
     """
     Container for all claims extracted from a text.
     """
+    model_config = _LLM_CONFIG
+
     claims: List[Claim] = Field(..., min_length=1, description="List of extracted claims")
     total_claims: int = Field(..., ge=1, description="Total number of claims extracted")
 
-    @field_validator('total_claims')
-    @classmethod
-    def validate_count_matches(cls, v: int, info) -> int:
-        if 'claims' in info.data and len(info.data['claims']) != v:
-            raise ValueError(f"total_claims ({v}) must match actual claims count ({len(info.data['claims'])})")
-        return v
+    @model_validator(mode='after')
+    def validate_count_matches(self) -> 'ClaimsExtraction':
+        if len(self.claims) != self.total_claims:
+            raise ValueError(f"total_claims ({self.total_claims}) must match actual claims count ({len(self.claims)})")
+        return self
+
+
+class CounterfactualSet(BaseModel):
+    """
+    Alternative explanations generated for one type of flagged issue.
+    """
+    model_config = _LLM_CONFIG
+
+    fallacy_type: str = Field(..., description="Name of the issue these alternatives address")
+    alternatives: List[str] = Field(..., min_length=1, description="Alternative explanations (1-2 sentences each)")
+
+
+class CounterfactualsBatch(BaseModel):
+    """
+    Counterfactuals for several issue types, generated in a single LLM call.
+    """
+    model_config = _LLM_CONFIG
+
+    counterfactuals: List[CounterfactualSet] = Field(..., min_length=1, description="One entry per issue type")
 
 
 class StatisticalCheck(BaseModel):
     """
     Result of a deterministic statistical validation check.
     """
+    model_config = _INTERNAL_CONFIG
+
     check_name: str = Field(..., description="Name of the check performed")
     passed: bool = Field(..., description="Whether the check passed")
     severity: Literal["low", "medium", "high", "critical"] = Field(
@@ -71,6 +104,8 @@ class ClaimAudit(BaseModel):
     """
     Complete audit report for a single claim.
     """
+    model_config = _INTERNAL_CONFIG
+
     claim_id: str = Field(..., description="ID of the claim being audited")
     claim_quote: str = Field(..., description="The original claim text")
     checks_performed: List[StatisticalCheck] = Field(..., description="All checks run on this claim")
@@ -86,12 +121,24 @@ class ClaimAudit(BaseModel):
             raise ValueError("claim_id must reference a valid claim (format: 'c1', 'c2', etc.)")
         return v
 
+    @cached_property
+    def failed_checks(self) -> List[StatisticalCheck]:
+        """Checks that did not pass (computed once, reused by the UI and scoring)."""
+        return [c for c in self.checks_performed if not c.passed]
+
+    @cached_property
+    def failed_check_names(self) -> FrozenSet[str]:
+        """Names of the checks that did not pass."""
+        return frozenset(c.check_name for c in self.failed_checks)
+
 
 class TextMetrics(BaseModel):
     """
     Quantitative metrics calculated by Python (not LLM).
     This is the "Stats Layer" - deterministic analysis.
     """
+    model_config = _INTERNAL_CONFIG
+
     data_density_score: float = Field(..., ge=0.0, le=1.0, description="% of sentences with numbers/data")
     vagueness_score: float = Field(..., ge=0.0, le=1.0, description="Ratio of hedge words to definitive claims")
     extreme_language_count: int = Field(..., ge=0, description="Count of absolute terms (always/never/prove)")
@@ -103,6 +150,8 @@ class AuditReport(BaseModel):
     """
     Final audit report combining LLM extraction with Python validation.
     """
+    model_config = _INTERNAL_CONFIG
+
     text_metrics: TextMetrics = Field(..., description="Quantitative analysis from Python")
     claim_audits: List[ClaimAudit] = Field(..., description="Per-claim audit results")
     overall_reliability_score: float = Field(..., ge=0.0, le=100.0, description="Aggregated reliability score")
@@ -6,7 +6,8 @@ This is where your stats expertise shines - code handles the math, not Claude.
 """
 
 import re
-from typing import List, Dict, Tuple
+from functools import cached_property, lru_cache
+from typing import List, Dict, NamedTuple, Tuple
 from .schemas import Claim, StatisticalCheck, TextMetrics
 
 
@@ -78,6 +79,123 @@ COMPARATOR_WORDS = [
 ]
 
 
+def _fuse(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """
+    Combine a pattern list into a single alternation.
+
+    One fused scan visits the text once instead of once per pattern. The word
+    lists have no overlapping entries, so match counts are unchanged.
+    """
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+# Fused scanners used by calculate_text_metrics and the claim checks
+# (compiled once at import, case-insensitive)
+_HEDGE_RE = _fuse(HEDGE_WORDS, re.IGNORECASE)
+_EXTREME_RE = _fuse(EXTREME_WORDS, re.IGNORECASE)
+_CAUSATION_RE = _fuse(CAUSATION_WORDS, re.IGNORECASE)
+_SAMPLE_SIZE_RE = _fuse(SAMPLE_SIZE_PATTERNS, re.IGNORECASE)
+_NUMBER_RE = _fuse(NUMBER_PATTERNS, re.IGNORECASE)
+_RISK_MULTIPLIER_RE = _fuse(RISK_MULTIPLIER_PATTERNS, re.IGNORECASE)
+_RISK_RE = _fuse(RISK_WORDS, re.IGNORECASE)
+_EFFECT_RE = _fuse(EFFECT_WORDS, re.IGNORECASE)
+_COMPARATOR_RE = _fuse(COMPARATOR_WORDS, re.IGNORECASE)
+
+# Per-word extreme patterns, for naming the first match of each in the explanation
+_EXTREME_PATTERNS = [re.compile(p, re.IGNORECASE) for p in EXTREME_WORDS]
+
+# Quantitative keywords that should have numbers. Matched as substrings on
+# purpose: "significantly", "largely" and "commonly" count as well
+QUANT_KEYWORDS = (
+    'significant', 'substantial', 'large', 'small', 'majority',
+    'minority', 'most', 'few', 'many', 'rare', 'common'
+)
+
+_QUANT_KEYWORD_RE = re.compile('|'.join(QUANT_KEYWORDS))
+
+# Substring match, so "cures" and "guaranteed" escalate too
+_HIGH_SEVERITY_EXTREME_RE = re.compile(r'will|cure|guarantee|must')
+
+# Map sentence terminators onto '.', so splitting needs no regex
+_SENTENCE_END_TRANS = str.maketrans('!?', '..')
+
+# Every NUMBER_PATTERNS entry needs a digit, so this cheap scan rules out most prose
+_DIGIT_RE = re.compile(r'\d')
+
+# Compiled once at import; the check methods below run these per claim
+_EXPERIMENTAL_RE = re.compile(
+    r'\brandomized\b|\bcontrolled trial\b|\bRCT\b|\bexperiment\b|\bintervention\b',
+    re.IGNORECASE
+)
+
+_CLAIM_NUMBER_RE = re.compile(r'\d+%|\d+\s*percent|\d+\.?\d*\s*times')
+
+_PERCENT_RE = re.compile(r'\d+%|\d+\s*percent')
+
+_RELATIVE_RE = re.compile(r'increase[sd]?|decrease[sd]?|more|less|higher|lower|times')
+
+_MULTIPLIER_RE = re.compile(r'\d+x\b')
+
+_BASE_RATE_ABSOLUTE_RE = re.compile(r'\bof\s+\d+|\bout of\s+\d+|from\s+\d+\s+to\s+\d+|n\s*=\s*\d+')
+
+_RISK_ABSOLUTE_RE = re.compile(
+    r'\bfrom\s+\d+\.?\d*%?\s+to\s+\d+\.?\d*%?|\bout of\s+\d+|'
+    r'\bof\s+\d+|\bin\s+\d+|\b\d+\.?\d*%\s+to\s+\d+\.?\d*%|'
+    r'\babsolute risk'
+)
+
+# Implicit comparators: "increased by X%", "from X to Y" imply comparison to previous state
+_IMPLICIT_COMPARATOR_RE = re.compile(
+    r'\b(increase[ds]?|decrease[ds]?|reduced?|improved?|rose|fell|dropped|grew|enhanced?)\s+(by|from|to)\s+\d+|'
+    r'\bfrom\s+\d+.*?\bto\s+\d+'  # "from X to Y" pattern
+)
+
+_RESEARCH_CONTEXT_RE = re.compile(
+    r'\bstudy\b|\bresearch\b|\btrial\b|\btest\b|\bparticipants?\b|\bsubjects?\b'
+)
+
+
+# Passing results are identical for every claim, so each check returns one
+# shared instance instead of building a new model. Treat them as read-only.
+_CLEAN: Dict[str, StatisticalCheck] = {
+    "Correlation vs Causation": StatisticalCheck(
+        check_name="Correlation vs Causation", passed=True, severity="low",
+        explanation="No inappropriate causal language detected."
+    ),
+    "Sample Size Disclosure": StatisticalCheck(
+        check_name="Sample Size Disclosure", passed=True, severity="low",
+        explanation="Sample size mentioned or not required for this claim type."
+    ),
+    "Extreme Language": StatisticalCheck(
+        check_name="Extreme Language", passed=True, severity="low",
+        explanation="No problematic absolute language detected."
+    ),
+    "Base Rate Neglect": StatisticalCheck(
+        check_name="Base Rate Neglect", passed=True, severity="low",
+        explanation="Base rates provided or not applicable."
+    ),
+    "Data Support": StatisticalCheck(
+        check_name="Data Support", passed=True, severity="low",
+        explanation="Claims are appropriately supported with data or don't require it."
+    ),
+    "Relative Risk Without Context": StatisticalCheck(
+        check_name="Relative Risk Without Context", passed=True, severity="low",
+        explanation="Relative risk properly contextualized or not applicable."
+    ),
+    "Missing Comparator": StatisticalCheck(
+        check_name="Missing Comparator", passed=True, severity="low",
+        explanation="Comparisons are properly specified or not required."
+    ),
+}
+
+
+class _PreparedClaim(NamedTuple):
+    """The claim fields the checks read, with the quote lowercased once."""
+    quote: str
+    quote_lower: str
+    numerical_values: Tuple[str, ...]
+
+
 class StatisticalAnalyzer:
     """
     Performs deterministic statistical analysis on text and claims.
@@ -98,18 +216,41 @@ class StatisticalAnalyzer:
         Split text into sentences.
         Simple implementation - can be improved with NLP library if needed.
         """
-        # Basic sentence splitting on period, exclamation, question mark
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Basic sentence splitting on period, exclamation, question mark;
+        # runs of terminators leave empty pieces, which the filter drops
+        pieces = text.translate(_SENTENCE_END_TRANS).split('.')
+        return [s for s in map(str.strip, pieces) if s]
 
     def calculate_text_metrics(self) -> TextMetrics:
         """
         Calculate all text-level metrics using Python (not LLM).
 
+        The text is scanned once per analyzer; later calls reuse the result.
+
         Returns:
             TextMetrics with all calculated scores
         """
-        return TextMetrics(
+        return self._text_metrics
+
+    @cached_property
+    def _text_lower(self) -> str:
+        """Lowercased text, shared by the whole-text word counts."""
+        return self.text.lower()
+
+    @cached_property
+    def _total_words(self) -> int:
+        """Whitespace-separated word count of the text."""
+        return len(self.text.split())
+
+    @cached_property
+    def _text_metrics(self) -> TextMetrics:
+        """
+        Whole-text metrics, computed on first access.
+
+        Every value comes from the counters below and is already in range,
+        so validation is skipped here and in the failing-check branches.
+        """
+        return TextMetrics.model_construct(
             data_density_score=self._calculate_data_density(),
             vagueness_score=self._calculate_vagueness_score(),
             extreme_language_count=self._count_extreme_language(),
@@ -127,11 +268,11 @@ class StatisticalAnalyzer:
         if not self.sentences:
             return 0.0
 
-        sentences_with_numbers = 0
-        for sentence in self.sentences:
-            # Check if sentence contains any numerical patterns
-            if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in NUMBER_PATTERNS):
-                sentences_with_numbers += 1
+        # Count sentences containing any numerical pattern
+        sentences_with_numbers = sum(
+            1 for sentence in self.sentences
+            if _DIGIT_RE.search(sentence) and _NUMBER_RE.search(sentence)
+        )
 
         return sentences_with_numbers / len(self.sentences)
 
@@ -143,19 +284,13 @@ class StatisticalAnalyzer:
         Returns:
             Float between 0.0 and 1.0
         """
-        text_lower = self.text.lower()
-        total_words = len(self.text.split())
-
-        if total_words == 0:
+        if self._total_words == 0:
             return 0.0
 
-        hedge_count = sum(
-            len(re.findall(pattern, text_lower))
-            for pattern in HEDGE_WORDS
-        )
+        hedge_count = len(_HEDGE_RE.findall(self._text_lower))
 
         # Normalize to 0-1 scale (cap at 10% hedge words = score of 1.0)
-        return min(1.0, (hedge_count / total_words) * 10)
+        return min(1.0, (hedge_count / self._total_words) * 10)
 
     def _count_extreme_language(self) -> int:
         """
@@ -164,11 +299,7 @@ class StatisticalAnalyzer:
         Returns:
             Count of extreme words found
         """
-        text_lower = self.text.lower()
-        return sum(
-            len(re.findall(pattern, text_lower))
-            for pattern in EXTREME_WORDS
-        )
+        return len(_EXTREME_RE.findall(self._text_lower))
 
     def _check_sample_size_mentioned(self) -> bool:
         """
@@ -177,10 +308,7 @@ class StatisticalAnalyzer:
         Returns:
             True if sample size found, False otherwise
         """
-        return any(
-            re.search(pattern, self.text, re.IGNORECASE)
-            for pattern in SAMPLE_SIZE_PATTERNS
-        )
+        return _SAMPLE_SIZE_RE.search(self.text) is not None
 
     def _count_causation_language(self) -> int:
         """
@@ -189,66 +317,75 @@ class StatisticalAnalyzer:
         Returns:
             Count of causation words found
         """
-        text_lower = self.text.lower()
-        return sum(
-            len(re.findall(pattern, text_lower))
-            for pattern in CAUSATION_WORDS
-        )
+        return len(_CAUSATION_RE.findall(self._text_lower))
 
     def check_claim(self, claim: Claim) -> List[StatisticalCheck]:
         """
         Run all statistical checks on a single claim.
 
+        The checks only look at the quote and its numerical values, so results
+        are memoized on those and shared across analyzers.
+
         Args:
             claim: The claim to check
 
         Returns:
             List of StatisticalCheck results
         """
+        return list(_check_quote(claim.quote, tuple(claim.numerical_values)))
+
+    def check_claim_by_name(self, claim: Claim) -> Dict[str, StatisticalCheck]:
+        """
+        Run all statistical checks on a single claim, keyed by check name.
+
+        Args:
+            claim: The claim to check
+
+        Returns:
+            Dictionary mapping check_name to its StatisticalCheck, in check order
+        """
+        return {check.check_name: check for check in self.check_claim(claim)}
+
+    @classmethod
+    def _run_checks(cls, claim: _PreparedClaim) -> List[StatisticalCheck]:
+        """Run the seven claim checks in display order."""
         checks = []
 
         # Check 1: Correlation vs Causation
-        checks.append(self._check_correlation_vs_causation(claim))
+        checks.append(cls._check_correlation_vs_causation(claim))
 
         # Check 2: Sample Size
-        checks.append(self._check_sample_size(claim))
+        checks.append(cls._check_sample_size(claim))
 
         # Check 3: Extreme Language
-        checks.append(self._check_extreme_language_in_claim(claim))
+        checks.append(cls._check_extreme_language_in_claim(claim))
 
         # Check 4: Base Rate
-        checks.append(self._check_base_rate(claim))
+        checks.append(cls._check_base_rate(claim))
 
         # Check 5: Data Support
-        checks.append(self._check_data_support(claim))
+        checks.append(cls._check_data_support(claim))
 
         # Check 6: Relative Risk Without Context (HIGH severity)
-        checks.append(self._check_relative_risk_without_context(claim))
+        checks.append(cls._check_relative_risk_without_context(claim))
 
         # Check 7: Missing Comparator
-        checks.append(self._check_missing_comparator(claim))
+        checks.append(cls._check_missing_comparator(claim))
 
         return checks
 
-    def _check_correlation_vs_causation(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_correlation_vs_causation(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check if claim uses causal language (content-based, not type-based).
         """
-        quote_lower = claim.quote.lower()
-        has_causation_words = any(
-            re.search(pattern, quote_lower)
-            for pattern in CAUSATION_WORDS
-        )
+        has_causation_words = bool(_CAUSATION_RE.search(claim.quote_lower))
 
         # Check for experimental evidence markers
-        has_experimental_evidence = bool(re.search(
-            r'\brandomized\b|\bcontrolled trial\b|\bRCT\b|\bexperiment\b|\bintervention\b',
-            claim.quote,
-            re.IGNORECASE
-        ))
+        has_experimental_evidence = bool(_EXPERIMENTAL_RE.search(claim.quote))
 
         if has_causation_words and not has_experimental_evidence:
-            return StatisticalCheck(
+            return StatisticalCheck.model_construct(
                 check_name="Correlation vs Causation",
                 passed=False,
                 severity="high",
@@ -257,30 +394,22 @@ class StatisticalAnalyzer:
                 suggestion="Either provide experimental evidence or rephrase using correlational language: 'associated with', 'correlated with', 'linked to'"
             )
 
-        return StatisticalCheck(
-            check_name="Correlation vs Causation",
-            passed=True,
-            severity="low",
-            explanation="No inappropriate causal language detected."
-        )
+        return _CLEAN["Correlation vs Causation"]
 
-    def _check_sample_size(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_sample_size(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check if statistical claims mention sample size.
         """
         # Check if claim contains numbers/percentages (content-based, not type-based)
-        quote_lower = claim.quote.lower()
-        has_numbers = bool(re.search(r'\d+%|\d+\s*percent|\d+\.?\d*\s*times', quote_lower))
+        has_numbers = bool(_CLAIM_NUMBER_RE.search(claim.quote_lower))
 
         if has_numbers or claim.numerical_values:
             # Check if sample size is mentioned in the claim or nearby context
-            has_sample_size = any(
-                re.search(pattern, claim.quote, re.IGNORECASE)
-                for pattern in SAMPLE_SIZE_PATTERNS
-            )
+            has_sample_size = bool(_SAMPLE_SIZE_RE.search(claim.quote))
 
             if not has_sample_size:
-                return StatisticalCheck(
+                return StatisticalCheck.model_construct(
                     check_name="Sample Size Disclosure",
                     passed=False,
                     severity="medium",
@@ -289,64 +418,48 @@ class StatisticalAnalyzer:
                     suggestion="Include sample size: 'n=X' or 'based on X participants'"
                 )
 
-        return StatisticalCheck(
-            check_name="Sample Size Disclosure",
-            passed=True,
-            severity="low",
-            explanation="Sample size mentioned or not required for this claim type."
-        )
+        return _CLEAN["Sample Size Disclosure"]
 
-    def _check_extreme_language_in_claim(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_extreme_language_in_claim(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check for absolute terms without appropriate qualification.
         """
-        quote_lower = claim.quote.lower()
-        extreme_matches = [
-            pattern for pattern in EXTREME_WORDS
-            if re.search(pattern, quote_lower)
-        ]
-
-        if extreme_matches:
+        if _EXTREME_RE.search(claim.quote_lower):
             # Find which extreme words were matched for better explanation
-            matched_words = []
-            for pattern in extreme_matches:
-                match = re.search(pattern, quote_lower)
-                if match:
-                    matched_words.append(match.group())
+            matched_words = [
+                match.group() for match in
+                (pattern.search(claim.quote_lower) for pattern in _EXTREME_PATTERNS)
+                if match
+            ]
 
-            return StatisticalCheck(
+            return StatisticalCheck.model_construct(
                 check_name="Extreme Language",
                 passed=False,
-                severity="high" if any(word in quote_lower for word in ['will', 'cure', 'guarantee', 'must']) else "medium",
+                severity="high" if _HIGH_SEVERITY_EXTREME_RE.search(claim.quote_lower) else "medium",
                 explanation=f"Claim uses absolute language: '{', '.join(matched_words[:3])}'. "
                            f"Words like 'always', 'never', 'will', 'cure', 'guarantee' are rarely justified in science.",
                 suggestion="Use qualified language: 'often', 'may', 'suggests', 'can help', 'associated with'"
             )
 
-        return StatisticalCheck(
-            check_name="Extreme Language",
-            passed=True,
-            severity="low",
-            explanation="No problematic absolute language detected."
-        )
+        return _CLEAN["Extreme Language"]
 
-    def _check_base_rate(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_base_rate(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check if percentages or rates mention the base/denominator.
         """
-        quote_lower = claim.quote.lower()
-
         # Check for percentages or relative terms (content-based, not type-based)
-        has_percentage = bool(re.search(r'\d+%|\d+\s*percent', quote_lower))
-        has_relative = bool(re.search(r'increase[sd]?|decrease[sd]?|more|less|higher|lower|times', quote_lower))
-        has_multiplier = bool(re.search(r'\d+x\b', quote_lower))
+        has_percentage = bool(_PERCENT_RE.search(claim.quote_lower))
+        has_relative = bool(_RELATIVE_RE.search(claim.quote_lower))
+        has_multiplier = bool(_MULTIPLIER_RE.search(claim.quote_lower))
 
         if has_percentage or has_relative or has_multiplier:
             # Check if absolute numbers or base rates are mentioned
-            has_absolute = bool(re.search(r'\bof\s+\d+|\bout of\s+\d+|from\s+\d+\s+to\s+\d+|n\s*=\s*\d+', quote_lower))
+            has_absolute = bool(_BASE_RATE_ABSOLUTE_RE.search(claim.quote_lower))
 
             if not has_absolute:
-                return StatisticalCheck(
+                return StatisticalCheck.model_construct(
                     check_name="Base Rate Neglect",
                     passed=False,
                     severity="medium",
@@ -355,29 +468,17 @@ class StatisticalAnalyzer:
                     suggestion="Include absolute numbers: '50% increase (from 100 to 150)' or baseline context"
                 )
 
-        return StatisticalCheck(
-            check_name="Base Rate Neglect",
-            passed=True,
-            severity="low",
-            explanation="Base rates provided or not applicable."
-        )
+        return _CLEAN["Base Rate Neglect"]
 
-    def _check_data_support(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_data_support(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check if claim has numerical support when making quantitative assertions.
         """
-        quote_lower = claim.quote.lower()
-
-        # Quantitative keywords that should have numbers
-        quant_keywords = [
-            'significant', 'substantial', 'large', 'small', 'majority',
-            'minority', 'most', 'few', 'many', 'rare', 'common'
-        ]
-
-        has_quant_keyword = any(keyword in quote_lower for keyword in quant_keywords)
+        has_quant_keyword = bool(_QUANT_KEYWORD_RE.search(claim.quote_lower))
 
         if has_quant_keyword and not claim.numerical_values:
-            return StatisticalCheck(
+            return StatisticalCheck.model_construct(
                 check_name="Data Support",
                 passed=False,
                 severity="medium",
@@ -386,44 +487,27 @@ class StatisticalAnalyzer:
                 suggestion="Replace vague terms with specific percentages or counts"
             )
 
-        return StatisticalCheck(
-            check_name="Data Support",
-            passed=True,
-            severity="low",
-            explanation="Claims are appropriately supported with data or don't require it."
-        )
+        return _CLEAN["Data Support"]
 
-    def _check_relative_risk_without_context(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_relative_risk_without_context(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check for relative risk claims (doubles, triples, X times) without absolute context.
         This is a HIGH severity specialized version of base rate check for risk language.
         """
-        quote_lower = claim.quote.lower()
-
         # Check for risk multiplier language
-        has_risk_multiplier = any(
-            re.search(pattern, quote_lower)
-            for pattern in RISK_MULTIPLIER_PATTERNS
-        )
+        has_risk_multiplier = bool(_RISK_MULTIPLIER_RE.search(claim.quote_lower))
 
         # Check for risk-related words
-        has_risk_word = any(
-            re.search(pattern, quote_lower)
-            for pattern in RISK_WORDS
-        )
+        has_risk_word = bool(_RISK_RE.search(claim.quote_lower))
 
         # If claim uses both risk language AND multipliers
         if has_risk_multiplier and has_risk_word:
             # Check if absolute context is provided
-            has_absolute = bool(re.search(
-                r'\bfrom\s+\d+\.?\d*%?\s+to\s+\d+\.?\d*%?|\bout of\s+\d+|'
-                r'\bof\s+\d+|\bin\s+\d+|\b\d+\.?\d*%\s+to\s+\d+\.?\d*%|'
-                r'\babsolute risk',
-                quote_lower
-            ))
+            has_absolute = bool(_RISK_ABSOLUTE_RE.search(claim.quote_lower))
 
             if not has_absolute:
-                return StatisticalCheck(
+                return StatisticalCheck.model_construct(
                     check_name="Relative Risk Without Context",
                     passed=False,
                     severity="high",
@@ -432,50 +516,31 @@ class StatisticalAnalyzer:
                     suggestion="Include absolute risk: 'increased from 0.5% to 1%' or 'affecting 2 in 10,000 people instead of 1 in 10,000'"
                 )
 
-        return StatisticalCheck(
-            check_name="Relative Risk Without Context",
-            passed=True,
-            severity="low",
-            explanation="Relative risk properly contextualized or not applicable."
-        )
+        return _CLEAN["Relative Risk Without Context"]
 
-    def _check_missing_comparator(self, claim: Claim) -> StatisticalCheck:
+    @staticmethod
+    def _check_missing_comparator(claim: _PreparedClaim) -> StatisticalCheck:
         """
         Check for improvement/effect claims without stating what they're compared to.
         Catches both missing control groups in studies and vague marketing claims.
         """
-        quote_lower = claim.quote.lower()
-
         # Check for effect/improvement language
-        has_effect_claim = any(
-            re.search(pattern, quote_lower)
-            for pattern in EFFECT_WORDS
-        )
+        has_effect_claim = bool(_EFFECT_RE.search(claim.quote_lower))
 
         if has_effect_claim:
             # Check if comparator is mentioned
-            has_comparator = any(
-                re.search(pattern, quote_lower)
-                for pattern in COMPARATOR_WORDS
-            )
+            has_comparator = bool(_COMPARATOR_RE.search(claim.quote_lower))
 
             # Check for implicit comparators: "increased by X%", "from X to Y" implies comparison to previous state
-            has_implicit_comparator = bool(re.search(
-                r'\b(increase[ds]?|decrease[ds]?|reduced?|improved?|rose|fell|dropped|grew|enhanced?)\s+(by|from|to)\s+\d+|'
-                r'\bfrom\s+\d+.*?\bto\s+\d+',  # "from X to Y" pattern
-                quote_lower
-            ))
+            has_implicit_comparator = bool(_IMPLICIT_COMPARATOR_RE.search(claim.quote_lower))
 
             if not has_comparator and not has_implicit_comparator:
                 # Determine severity based on context
-                is_research_claim = bool(re.search(
-                    r'\bstudy\b|\bresearch\b|\btrial\b|\btest\b|\bparticipants?\b|\bsubjects?\b',
-                    quote_lower
-                ))
+                is_research_claim = bool(_RESEARCH_CONTEXT_RE.search(claim.quote_lower))
 
                 severity = "high" if is_research_claim else "medium"
 
-                return StatisticalCheck(
+                return StatisticalCheck.model_construct(
                     check_name="Missing Comparator",
                     passed=False,
                     severity=severity,
@@ -484,12 +549,30 @@ class StatisticalAnalyzer:
                     suggestion="Specify the comparison: 'improved compared to placebo', 'better than standard treatment', 'reduced vs. baseline'"
                 )
 
-        return StatisticalCheck(
-            check_name="Missing Comparator",
-            passed=True,
-            severity="low",
-            explanation="Comparisons are properly specified or not required."
-        )
+        return _CLEAN["Missing Comparator"]
+
+
+@lru_cache(maxsize=10_000)
+def _check_quote(quote: str, numerical_values: Tuple[str, ...]) -> Tuple[StatisticalCheck, ...]:
+    """
+    Memoized claim checks, keyed on the only claim fields they read.
+
+    Repeated quotes (re-audits, the same claim across articles) skip the regex
+    work. Results are frozen models, so sharing them between callers is safe.
+    """
+    claim = _PreparedClaim(quote, quote.lower(), numerical_values)
+    return tuple(StatisticalAnalyzer._run_checks(claim))
+
+
+@lru_cache(maxsize=32)
+def _get_analyzer(text: str) -> StatisticalAnalyzer:
+    """
+    Shared analyzer for a text, so analyze_text and check_claims on the same
+    text split and lowercase it only once.
+
+    Keyed by string equality; an analyzer holds no per-claim state.
+    """
+    return StatisticalAnalyzer(text)
 
 
 def analyze_text(text: str) -> TextMetrics:
@@ -502,8 +585,7 @@ def analyze_text(text: str) -> TextMetrics:
     Returns:
         TextMetrics with calculated scores
     """
-    analyzer = StatisticalAnalyzer(text)
-    return analyzer.calculate_text_metrics()
+    return _get_analyzer(text).calculate_text_metrics()
 
 
 def check_claims(text: str, claims: List[Claim]) -> Dict[str, List[StatisticalCheck]]:
@@ -517,7 +599,7 @@ def check_claims(text: str, claims: List[Claim]) -> Dict[str, List[StatisticalCh
     Returns:
         Dictionary mapping claim_id to list of check results
     """
-    analyzer = StatisticalAnalyzer(text)
+    analyzer = _get_analyzer(text)
     return {
         claim.claim_id: analyzer.check_claim(claim)
         for claim in claims
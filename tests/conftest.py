@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nuance.statistical_checks import StatisticalAnalyzer
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """One analyzer for the claim-level tests; check_claim doesn't depend on its text."""
+    return StatisticalAnalyzer("Test text")
@@ -0,0 +1,72 @@
+"""
+Test that memoized claim checks and check_claims match the uncached, serial results
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nuance.schemas import Claim
+from nuance.statistical_checks import check_claims
+
+
+def _claim(claim_id, quote, numerical_values=()):
+    return Claim(
+        claim_id=claim_id,
+        quote=quote,
+        claim_type="statistical",
+        confidence=0.9,
+        variables=[],
+        numerical_values=list(numerical_values)
+    )
+
+
+def test_repeated_quote_returns_equal_results(analyzer):
+    """A quote seen twice gets the same checks, and callers get their own list."""
+    quote = "Red wine always prevents heart disease"
+    first = analyzer.check_claim(_claim("c1", quote))
+    second = analyzer.check_claim(_claim("c2", quote))
+
+    assert first == second
+    assert first is not second
+
+
+def test_numerical_values_are_part_of_the_memo_key(analyzer):
+    """The same quote with and without extracted numbers is checked separately."""
+    quote = "A significant majority of users improved"
+
+    without_numbers = analyzer.check_claim_by_name(_claim("c1", quote))
+    with_numbers = analyzer.check_claim_by_name(_claim("c2", quote, ["62%"]))
+
+    assert not without_numbers["Data Support"].passed
+    assert with_numbers["Data Support"].passed
+    assert without_numbers["Sample Size Disclosure"].passed
+    assert not with_numbers["Sample Size Disclosure"].passed
+
+    # Order of first use must not matter either
+    assert not analyzer.check_claim_by_name(_claim("c3", quote))["Data Support"].passed
+
+
+def test_check_claims_matches_serial_path(analyzer):
+    """check_claims keys and orders results exactly like calling check_claim per claim."""
+    claims = [
+        _claim("c3", "Coffee drinking doubles your risk of heart disease"),
+        _claim("c1", "This supplement regulates blood sugar"),
+        _claim("c4", "Most experts agree it is 100% safe"),
+        _claim("c2", "The study of 500 participants found a 20% increase", ["500", "20%"]),
+        _claim("c5", "Sleep may help memory"),
+    ]
+
+    results = check_claims("Some article text", claims)
+
+    assert list(results) == [claim.claim_id for claim in claims]
+    for claim in claims:
+        assert results[claim.claim_id] == analyzer.check_claim(claim)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,60 @@
+"""
+Pin the field order of counterfactual items across both batch entry points (no API key needed)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nuance.claude_client import ClaudeClient, CounterfactualItem, batch_counterfactuals
+
+
+ITEM = CounterfactualItem(
+    fallacy_type="Extreme Language",
+    claim_quote="Wine always prevents heart disease",
+    check_explanation="Uses absolute language"
+)
+
+
+def test_item_field_order():
+    """Positional construction follows (fallacy_type, claim_quote, check_explanation)."""
+    assert CounterfactualItem._fields == ("fallacy_type", "claim_quote", "check_explanation")
+    assert CounterfactualItem("a", "b", "c") == CounterfactualItem(
+        fallacy_type="a", claim_quote="b", check_explanation="c"
+    )
+
+
+def test_batch_prompt_uses_item_fields():
+    """The single-call batch prompt puts each field in its own slot."""
+    client = ClaudeClient(api_key="test-key", use_cache=False)
+    prompt = client._build_counterfactual_batch_prompt([ITEM])
+
+    assert (
+        'Issue: Extreme Language\n'
+        'Claim: "Wine always prevents heart disease"\n'
+        "Why it's problematic: Uses absolute language\n"
+    ) in prompt
+
+
+def test_concurrent_batch_uses_item_fields():
+    """batch_counterfactuals forwards each field to the matching parameter."""
+    calls = []
+
+    class RecordingClient:
+        async def agenerate_counterfactuals(self, claim_quote, fallacy_type, check_explanation):
+            calls.append((claim_quote, fallacy_type, check_explanation))
+            return [fallacy_type]
+
+    results = asyncio.run(batch_counterfactuals(RecordingClient(), [ITEM]))
+
+    assert calls == [(ITEM.claim_quote, ITEM.fallacy_type, ITEM.check_explanation)]
+    assert results == [["Extreme Language"]]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -5,20 +5,19 @@ Test health/supplement marketing claims with new medical verbs
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from nuance.schemas import Claim
-from nuance.statistical_checks import StatisticalAnalyzer
 
 
-def test_health_marketing_claims():
+def test_health_marketing_claims(analyzer):
     """Test that we catch vague health supplement marketing."""
     print("\n🧪 Testing Health Marketing Claims")
     print("=" * 70)
 
-    analyzer = StatisticalAnalyzer("Test text")
-
     test_cases = [
         {
             "quote": "This supplement regulates blood sugar",
@@ -62,8 +61,8 @@ def test_health_marketing_claims():
             numerical_values=[]
         )
 
-        checks = analyzer.check_claim(claim)
-        comparator_check = [c for c in checks if c.check_name == test["check"]][0]
+        checks = analyzer.check_claim_by_name(claim)
+        comparator_check = checks[test["check"]]
 
         expected = "FAIL" if test["should_fail"] else "PASS"
         actual = "FAIL" if not comparator_check.passed else "PASS"
@@ -89,16 +88,4 @@ def test_health_marketing_claims():
 
 
 if __name__ == "__main__":
-    print("\n🔬 TESTING HEALTH SUPPLEMENT MARKETING DETECTION\n")
-
-    try:
-        test_health_marketing_claims()
-        print("\n" + "=" * 70)
-        print("🎉 Perfect for catching BS supplement claims!")
-        print("=" * 70)
-
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-s"]))
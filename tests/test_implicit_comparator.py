@@ -5,20 +5,19 @@ Test that implicit comparators are recognized (e.g., "increased by 300%")
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from nuance.schemas import Claim
-from nuance.statistical_checks import StatisticalAnalyzer
 
 
-def test_implicit_comparators():
+def test_implicit_comparators(analyzer):
     """Test that implicit comparators are properly recognized."""
     print("\n🧪 Testing Implicit Comparator Recognition")
     print("=" * 70)
 
-    analyzer = StatisticalAnalyzer("Test text")
-
     test_cases = [
         {
             "quote": "Sales increased by 300%",
@@ -67,8 +66,8 @@ def test_implicit_comparators():
             numerical_values=[]
         )
 
-        checks = analyzer.check_claim(claim)
-        comparator_check = [c for c in checks if c.check_name == "Missing Comparator"][0]
+        checks = analyzer.check_claim_by_name(claim)
+        comparator_check = checks["Missing Comparator"]
 
         expected = "FAIL" if test["should_fail"] else "PASS"
         actual = "FAIL" if not comparator_check.passed else "PASS"
@@ -90,16 +89,4 @@ def test_implicit_comparators():
 
 
 if __name__ == "__main__":
-    print("\n🔬 TESTING IMPLICIT COMPARATOR LOGIC\n")
-
-    try:
-        test_implicit_comparators()
-        print("\n" + "=" * 70)
-        print("🎉 Implicit comparators correctly recognized!")
-        print("=" * 70)
-
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-s"]))
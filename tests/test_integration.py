@@ -6,6 +6,8 @@ Tests statistical checks without requiring API key.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -121,22 +123,4 @@ def test_schema_validation():
 
 
 if __name__ == "__main__":
-    print("\n" + "🔬 NUANCE INTEGRATION TEST" + "\n")
-
-    try:
-        test_schema_validation()
-        test_statistical_analyzer()
-
-        print("\n" + "=" * 60)
-        print("🎉 ALL INTEGRATION TESTS PASSED!")
-        print("=" * 60)
-        print("\nNext steps:")
-        print("1. Set up your .env file with ANTHROPIC_API_KEY")
-        print("2. Run: streamlit run app.py")
-        print("3. Test with real articles!")
-
-    except Exception as e:
-        print(f"\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,154 @@
+"""
+Test the Claude response cache: memory LRU, opt-in SQLite layer, env settings
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nuance import llm_cache
+from nuance.claude_client import COUNTERFACTUAL_TEMPERATURE, ClaudeClient
+from nuance.llm_cache import LLMCache, get_cache, prompt_hash
+
+
+def test_memory_round_trip():
+    """A memory-only cache returns what was stored and misses otherwise."""
+    cache = LLMCache()
+    key = prompt_hash("model", "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, "response")
+    assert cache.get(key) == "response"
+    assert cache._db is None
+
+
+def test_disk_round_trip(tmp_path):
+    """Responses written to the SQLite layer survive a new cache instance."""
+    path = tmp_path / "llm.sqlite"
+    LLMCache(path).set("k", "persisted")
+
+    assert LLMCache(path).get("k") == "persisted"
+
+
+def test_memory_only_entries_are_not_persisted(tmp_path):
+    """persist=False keeps a response out of the SQLite file."""
+    path = tmp_path / "llm.sqlite"
+    cache = LLMCache(path)
+    cache.set("k", "sampled", persist=False)
+
+    assert cache.get("k") == "sampled"
+    assert LLMCache(path).get("k") is None
+
+
+def test_lru_evicts_oldest_at_512():
+    """The in-memory layer keeps the 512 most recently used entries."""
+    cache = LLMCache()
+    for i in range(512):
+        cache.set(f"k{i}", str(i))
+
+    cache.get("k0")  # refresh k0 so k1 becomes the oldest
+    cache.set("k512", "512")
+
+    assert len(cache._memory) == 512
+    assert cache.get("k0") == "0"
+    assert cache.get("k1") is None
+    assert cache.get("k512") == "512"
+
+
+def test_disk_row_cap(tmp_path):
+    """The SQLite layer evicts its oldest rows beyond max_rows."""
+    path = tmp_path / "llm.sqlite"
+    cache = LLMCache(path, max_rows=3)
+    for i in range(5):
+        cache.set(f"k{i}", str(i))
+
+    fresh = LLMCache(path, max_rows=3)
+    assert [fresh.get(f"k{i}") for i in range(5)] == [None, None, "2", "3", "4"]
+
+
+def test_disk_ttl(tmp_path):
+    """Rows older than the TTL are treated as misses."""
+    path = tmp_path / "llm.sqlite"
+    LLMCache(path).set("k", "stale")
+
+    assert LLMCache(path, ttl_seconds=-1).get("k") is None
+
+
+def test_unwritable_path_falls_back_to_memory(tmp_path):
+    """A path that can't be created leaves a working memory-only cache."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    cache = LLMCache(blocker / "llm.sqlite")
+
+    assert cache._db is None
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+
+
+def test_sqlite_errors_are_misses_and_no_ops(tmp_path):
+    """A failing database (e.g. locked by another process) never raises."""
+    path = tmp_path / "llm.sqlite"
+    cache = LLMCache(path)
+    cache.set("k", "v")
+    cache._memory.clear()
+    cache._db.close()
+
+    assert cache.get("k") is None
+    cache.set("k2", "v2")
+    assert cache.get("k2") == "v2"
+
+
+@pytest.fixture
+def fresh_default_cache(monkeypatch):
+    """Reset the process-wide cache so each test sees its own env setting."""
+    monkeypatch.setattr(llm_cache, "_default_cache", None)
+    return monkeypatch
+
+
+def test_get_cache_defaults_to_memory_only(fresh_default_cache):
+    fresh_default_cache.delenv("NUANCE_LLM_CACHE", raising=False)
+    cache = get_cache()
+
+    assert cache is not None
+    assert cache._db is None
+
+
+def test_get_cache_off(fresh_default_cache):
+    fresh_default_cache.setenv("NUANCE_LLM_CACHE", "off")
+
+    assert get_cache() is None
+
+
+def test_get_cache_path_enables_disk(fresh_default_cache, tmp_path):
+    path = tmp_path / "llm.sqlite"
+    fresh_default_cache.setenv("NUANCE_LLM_CACHE", str(path))
+    cache = get_cache()
+
+    assert cache._db is not None
+    assert get_cache() is cache
+
+
+def test_client_keeps_sampled_responses_in_memory(tmp_path):
+    """Sampled responses get their own key and never reach the SQLite file."""
+    path = tmp_path / "llm.sqlite"
+    client = ClaudeClient(api_key="test-key", use_cache=False)
+    client.cache = LLMCache(path)
+
+    deterministic = client._cache_key("kind", "prompt")
+    sampled = client._cache_key("kind", "prompt", COUNTERFACTUAL_TEMPERATURE)
+    assert deterministic != sampled
+
+    client._cache_set(deterministic, "kept")
+    client._cache_set(sampled, "fresh next time", COUNTERFACTUAL_TEMPERATURE)
+
+    reopened = LLMCache(path)
+    assert reopened.get(deterministic) == "kept"
+    assert reopened.get(sampled) is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
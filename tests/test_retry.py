@@ -0,0 +1,151 @@
+"""
+Test the validation retry loop against a fake streaming client (no API key needed)
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nuance.retry import (
+    RetryExhaustedError,
+    avalidate_with_retry,
+    extract_json_from_text,
+    validate_with_retry,
+)
+from nuance.schemas import CounterfactualSet
+
+
+VALID = json.dumps({"fallacy_type": "Extreme Language", "alternatives": ["Maybe not always"]})
+INITIAL = [{"role": "user", "content": "Generate alternatives"}]
+
+
+class _Stream:
+    """Context manager standing in for the SDK's MessageStream."""
+
+    def __init__(self, text):
+        self.text_stream = [text[:5], text[5:]]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _AsyncStream:
+    """Async counterpart of _Stream."""
+
+    def __init__(self, text):
+        self._chunks = [text[:5], text[5:]]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeClient:
+    """Returns scripted responses in order and records the messages sent."""
+
+    def __init__(self, responses, stream_class=_Stream):
+        self.responses = list(responses)
+        self.sent = []
+        self.messages = self
+        self._stream_class = stream_class
+
+    def stream(self, **kwargs):
+        self.sent.append(kwargs["messages"])
+        return self._stream_class(self.responses.pop(0))
+
+
+def _run(responses, max_retries=3):
+    client = FakeClient(responses)
+    result = validate_with_retry(client, "model", INITIAL, CounterfactualSet, max_retries=max_retries)
+    return result, client
+
+
+@pytest.mark.parametrize("text", [
+    f"```json\n{VALID}\n```",
+    f"Here you go:\n```\n{VALID}\n```\nDone.",
+    f"```json\n{VALID}",  # fence cut off by max_tokens
+    VALID,
+])
+def test_extract_json_from_text(text):
+    """Fenced JSON (with or without the json tag, closed or not) and bare JSON all parse."""
+    assert json.loads(extract_json_from_text(text)) == json.loads(VALID)
+
+
+def test_fenced_response_validates_first_try():
+    result, client = _run([f"```json\n{VALID}\n```"])
+
+    assert result.alternatives == ["Maybe not always"]
+    assert len(client.sent) == 1
+
+
+def test_invalid_json_then_valid():
+    """Malformed JSON is reported as a JSON parsing error and retried."""
+    result, client = _run(["{not json", VALID])
+
+    assert result.fallacy_type == "Extreme Language"
+    retry = client.sent[1]
+    assert retry[-2] == {"role": "assistant", "content": "{not json"}
+    assert "JSON parsing error" in retry[-1]["content"]
+
+
+def test_schema_error_is_labelled():
+    """Well-formed JSON that fails the schema is reported as a schema error."""
+    _, client = _run([json.dumps({"fallacy_type": "x", "alternatives": []}), VALID])
+
+    assert "Schema validation error" in client.sent[1][-1]["content"]
+
+
+def test_retry_history_does_not_grow():
+    """Each retry sends the original prompt plus only the latest failure."""
+    result, client = _run(["bad 1", "bad 2", "bad 3", VALID])
+
+    assert result is not None
+    assert client.sent[0] == INITIAL
+    for messages in client.sent[1:]:
+        assert len(messages) == len(INITIAL) + 2
+        assert messages[:len(INITIAL)] == INITIAL
+    assert client.sent[3][-2]["content"] == "bad 3"
+
+
+def test_exhausting_max_retries():
+    """max_retries + 1 failed attempts raise RetryExhaustedError."""
+    client = FakeClient(["bad"] * 3)
+
+    with pytest.raises(RetryExhaustedError):
+        validate_with_retry(client, "model", INITIAL, CounterfactualSet, max_retries=2)
+    assert len(client.sent) == 3
+
+
+def test_async_loop_matches_sync():
+    """The async loop retries the same way as the sync one."""
+    client = FakeClient(["{not json", VALID], stream_class=_AsyncStream)
+    result = asyncio.run(
+        avalidate_with_retry(client, "model", INITIAL, CounterfactualSet, max_retries=1)
+    )
+
+    assert result.alternatives == ["Maybe not always"]
+    assert len(client.sent[1]) == len(INITIAL) + 2
+
+    client = FakeClient(["bad", "bad"], stream_class=_AsyncStream)
+    with pytest.raises(RetryExhaustedError):
+        asyncio.run(avalidate_with_retry(client, "model", INITIAL, CounterfactualSet, max_retries=1))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))